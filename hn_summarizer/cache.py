@@ -0,0 +1,85 @@
+"""
+On-disk response caching for HN Summarizer.
+"""
+
+import os
+import sqlite3
+import threading
+import time
+from typing import Optional, Union
+
+from .config import CACHE_PATH, CACHE_MAX_STALE_AGE
+from .logging_config import get_logger
+
+CacheValue = Union[str, bytes]
+
+
+class ResponseCache:
+    """SQLite-backed key/value cache with per-entry expiry."""
+
+    def __init__(self, path: str = CACHE_PATH, max_stale_age: float = CACHE_MAX_STALE_AGE):
+        """
+        Args:
+            path: SQLite file to open, or ":memory:"
+            max_stale_age: Seconds past expiry after which entries are deleted on open
+        """
+        self.path = os.path.expanduser(path)
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        # Fetchers use thread pools, so share one connection behind a lock
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        # Every set() commits, so use WAL with relaxed syncing to keep those commits cheap;
+        # it also lets a second run read the cache while this one writes
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS responses "
+            "(key TEXT PRIMARY KEY, value BLOB, expires_at REAL)"
+        )
+        # Expired entries stay around for stale fallback, so without this the file would only grow
+        purged = self._conn.execute(
+            "DELETE FROM responses WHERE expires_at < ?", (time.time() - max_stale_age,)
+        ).rowcount
+        self._conn.commit()
+        self.logger = get_logger(self.__class__.__name__)
+        self.logger.debug(f"Opened response cache at {self.path}, purged {purged} old entries")
+
+    def get(self, key: str, allow_expired: bool = False) -> Optional[CacheValue]:
+        """
+        Look up a cached value.
+
+        Args:
+            key: Cache key (usually the request URL)
+            allow_expired: Return the entry even if its TTL has passed
+
+        Returns:
+            The cached value, or None on a miss
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value, expires_at FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+
+        if row is None:
+            return None
+        value, expires_at = row
+        if not allow_expired and expires_at < time.time():
+            return None
+        return value
+
+    def set(self, key: str, value: CacheValue, ttl: float) -> None:
+        """Store a value that expires after ttl seconds."""
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses (key, value, expires_at) VALUES (?, ?, ?)",
+                (key, value, time.time() + ttl),
+            )
+            self._conn.commit()
+
+    def close(self) -> None:
+        """Close the underlying database connection."""
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1,78 @@
+"""
+Circuit breaking for calls to remote LLM servers.
+"""
+
+import threading
+import time
+from typing import Optional, Tuple, Type
+
+from .logging_config import get_logger
+
+
+class CircuitOpenError(RuntimeError):
+    """Raised instead of making a call while the circuit is open."""
+
+
+class CircuitBreaker:
+    """
+    Fails calls fast after repeated errors, so an outage costs a few timeouts rather than one per article.
+
+    Used as a context manager around each call. Once fail_max consecutive calls
+    raise one of errors, the circuit opens and calls raise CircuitOpenError
+    without running until reset_timeout has passed. The next call is then let
+    through as a trial, while concurrent calls keep failing fast until it
+    finishes: success closes the circuit, failure reopens it.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        fail_max: int,
+        reset_timeout: float,
+        errors: Tuple[Type[BaseException], ...] = (Exception,),
+    ):
+        """
+        Args:
+            name: Name of the guarded service, used in errors and logs
+            fail_max: Consecutive failures that open the circuit
+            reset_timeout: Seconds to stay open before allowing a trial call
+            errors: Exception types that count as failures
+        """
+        self.name = name
+        self.fail_max = fail_max
+        self.reset_timeout = reset_timeout
+        self.errors = errors
+        self._lock = threading.Lock()
+        self._failures = 0
+        self._opened_at: Optional[float] = None
+        # Thread running the half-open trial call, if one is in progress
+        self._trial_thread: Optional[int] = None
+        self.logger = get_logger(self.__class__.__name__)
+
+    def __enter__(self) -> "CircuitBreaker":
+        with self._lock:
+            if self._opened_at is not None:
+                if self._trial_thread is not None or time.monotonic() - self._opened_at < self.reset_timeout:
+                    raise CircuitOpenError(f"{self.name} circuit is open after {self._failures} consecutive failures")
+                self._trial_thread = threading.get_ident()
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> bool:
+        with self._lock:
+            if self._trial_thread == threading.get_ident():
+                self._trial_thread = None
+            if exc_type is None:
+                if self._opened_at is not None:
+                    self.logger.info(f"{self.name} circuit closed after a successful trial call")
+                self._failures = 0
+                self._opened_at = None
+            elif issubclass(exc_type, self.errors):
+                self._failures += 1
+                if self._failures >= self.fail_max:
+                    if self._opened_at is None:
+                        self.logger.warning(
+                            f"{self.name} circuit opened after {self._failures} consecutive failures; "
+                            f"failing fast for {self.reset_timeout}s"
+                        )
+                    self._opened_at = time.monotonic()
+        return False
@@ -4,94 +4,99 @@ Command-line interface for the Hacker News summarizer
 
 import os
 import click
-from prettytable import PrettyTable
 from .summarizer import HackerNewsSummarizer
-from .logging_config import setup_logging, get_logger
+from .logging_config import setup_logging, stop_logging, get_logger
+
+
+# Escapes pipe characters so cell content cannot break the markdown table
+_PIPE_ESCAPE = str.maketrans({"|": "\\|"})
+
+
+def _cell(text, width):
+    """Truncate text to width characters (marking cuts with "...") and escape it for a table cell."""
+    if len(text) > width:
+        text = text[:width - 3] + "..."
+    return text.translate(_PIPE_ESCAPE)
+
+
+def _write_lines(lines, output_file):
+    """Write the whole rendered document to the output in a single call."""
+    output_file.write("\n".join(lines) + "\n")
 
 
 def _write_markdown_table(articles, output_file):
-    """Write articles in markdown table format using prettytable."""
-    click.echo("# Hacker News Article Summary\n", file=output_file)
+    """Write articles in markdown table format."""
+    lines = ["# Hacker News Article Summary\n"]
     
     # Create the markdown table manually for better formatting
-    click.echo("| # | Title | Score | Summary | URL |", file=output_file)
-    click.echo("|---|-------|-------|---------|-----|", file=output_file)
+    lines.append("| # | Title | Score | Summary | URL |")
+    lines.append("|---|-------|-------|---------|-----|")
     
     for i, article in enumerate(articles, 1):
-        title = article.get("title", "")
-        if len(title) > 40:
-            title = title[:37] + "..."
-        
+        title = _cell(article.get("title", ""), 40)
         score = article.get("score", "")
+        summary = _cell(" / ".join(article.get("summary", [])), 60)
+        url = _cell(article.get("url", ""), 50)
         
-        summary = " / ".join(article.get("summary", []))
-        if len(summary) > 60:
-            summary = summary[:57] + "..."
-        
-        url = article.get("url", "")
-        if len(url) > 50:
-            url = url[:47] + "..."
-        
-        # Escape pipe characters in content
-        title = title.replace("|", "\\|")
-        summary = summary.replace("|", "\\|")
-        url = url.replace("|", "\\|")
-        
-        click.echo(f"| {i} | {title} | {score} | {summary} | {url} |", file=output_file)
+        lines.append(f"| {i} | {title} | {score} | {summary} | {url} |")
     
-    click.echo("", file=output_file)
+    lines.append("")
     
     # Add enhanced information if available
     for i, article in enumerate(articles, 1):
         if "enhanced" in article and article["enhanced"]:
             enhanced = article["enhanced"]
-            click.echo(f"\n## Enhanced Analysis for Article {i}\n", file=output_file)
+            lines.append(f"\n## Enhanced Analysis for Article {i}\n")
             
             # Key insights
-            click.echo("### Key Insights\n", file=output_file)
+            lines.append("### Key Insights\n")
             for j, point in enumerate(enhanced.key_points, 1):
-                click.echo(f"{j}. {point}", file=output_file)
+                lines.append(f"{j}. {point}")
             
             # Related exploration links
-            click.echo("\n### Explore Deeper\n", file=output_file)
+            lines.append("\n### Explore Deeper\n")
             for j, link in enumerate(enhanced.related_links, 1):
-                click.echo(f"{j}. {link}", file=output_file)
+                lines.append(f"{j}. {link}")
             
             # Source links
-            click.echo("\n### Source Links\n", file=output_file)
+            lines.append("\n### Source Links\n")
             if enhanced.original_url:
-                click.echo(f"- [Original Article]({enhanced.original_url})", file=output_file)
-            click.echo(f"- [HN Discussion]({enhanced.hn_discussion_url})", file=output_file)
+                lines.append(f"- [Original Article]({enhanced.original_url})")
+            lines.append(f"- [HN Discussion]({enhanced.hn_discussion_url})")
+    
+    _write_lines(lines, output_file)
 
 
 def _write_text_format(articles, output_file):
     """Write articles in traditional text format."""
+    lines = []
     for i, article in enumerate(articles, 1):
         score = article["score"]
-        click.echo(f"\n--- Article {i} (Score: {score}) ---", file=output_file)
-        for line in article["summary"]:
-            click.echo(line, file=output_file)
+        lines.append(f"\n--- Article {i} (Score: {score}) ---")
+        lines.extend(article["summary"])
         
         # Display enhanced information if available
         if "enhanced" in article and article["enhanced"]:
             enhanced = article["enhanced"]
-            click.echo("\n=== ENHANCED ANALYSIS ===", file=output_file)
+            lines.append("\n=== ENHANCED ANALYSIS ===")
             
             # Key insights
-            click.echo("\n🔍 KEY INSIGHTS:", file=output_file)
+            lines.append("\n🔍 KEY INSIGHTS:")
             for j, point in enumerate(enhanced.key_points, 1):
-                click.echo(f"  {j}. {point}", file=output_file)
+                lines.append(f"  {j}. {point}")
             
             # Related exploration links
-            click.echo("\n🔗 EXPLORE DEEPER:", file=output_file)
+            lines.append("\n🔗 EXPLORE DEEPER:")
             for j, link in enumerate(enhanced.related_links, 1):
-                click.echo(f"  {j}. {link}", file=output_file)
+                lines.append(f"  {j}. {link}")
             
             # Source links
-            click.echo("\n📖 SOURCE LINKS:", file=output_file)
+            lines.append("\n📖 SOURCE LINKS:")
             if enhanced.original_url:
-                click.echo(f"  • Original Article: {enhanced.original_url}", file=output_file)
-            click.echo(f"  • HN Discussion: {enhanced.hn_discussion_url}", file=output_file)
+                lines.append(f"  • Original Article: {enhanced.original_url}")
+            lines.append(f"  • HN Discussion: {enhanced.hn_discussion_url}")
+    
+    _write_lines(lines, output_file)
 
 
 @click.command()
@@ -127,6 +132,11 @@ def _write_text_format(articles, output_file):
     default=False,
     help="Allow fallback to basic mode if ollama/llmapi fails (default: no fallback)",
 )
+@click.option(
+    "--cache/--no-cache",
+    default=False,
+    help="Cache HN API, article and LLM responses on disk between runs (default: no cache)",
+)
 @click.option(
     "--log-level",
     type=click.Choice(["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"], case_sensitive=False),
@@ -145,7 +155,7 @@ def _write_text_format(articles, output_file):
     default="text",
     help="Output format (default: text)",
 )
-def main(count: int, output, mode: str, ollama_model: str, fallback: bool, log_level: str, log_file: str, output_format: str):
+def main(count: int, output, mode: str, ollama_model: str, fallback: bool, cache: bool, log_level: str, log_file: str, output_format: str):
     """Fetch and summarize top Hacker News articles"""
     # Setup logging first
     setup_logging(level=log_level, log_file=log_file)
@@ -179,7 +189,7 @@ def main(count: int, output, mode: str, ollama_model: str, fallback: bool, log_l
             click.echo("=" * 60, file=output_file)
 
         logger.debug("Initializing HackerNewsSummarizer")
-        summarizer = HackerNewsSummarizer(mode=mode, ollama_model=ollama_model, allow_fallback=fallback)
+        summarizer = HackerNewsSummarizer(mode=mode, ollama_model=ollama_model, allow_fallback=fallback, use_cache=cache)
         
         logger.info("Starting article summarization process")
         articles = summarizer.summarize_articles(count)
@@ -214,6 +224,7 @@ def main(count: int, output, mode: str, ollama_model: str, fallback: bool, log_l
     finally:
         if output_path != "-":
             output_file.close()
+        stop_logging()
 
 
 if __name__ == "__main__":
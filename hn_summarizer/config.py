@@ -12,9 +12,41 @@ DEFAULT_USER_AGENT = (
     "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
 )
 REQUEST_TIMEOUT = 10
-RATE_LIMIT_DELAY = 1  # seconds between requests
+HN_API_RATE_LIMIT = 20  # requests per second to the CDN-fronted HN API
+ARTICLE_RATE_LIMIT = 2  # requests per second to each article host
+MAX_FETCH_WORKERS = 16  # concurrent HN API requests
+MAX_EXTRACT_WORKERS = 8  # concurrent article downloads
+MAX_LLM_WORKERS = 4  # concurrent Ollama/LLM API summary requests
+LLM_CIRCUIT_FAILURES = 5  # consecutive failed LLM requests before failing fast
+LLM_CIRCUIT_RESET = 60  # seconds to fail fast before trying the LLM server again
+ARTICLE_POOL_HOSTS = 32  # article hosts to keep keep-alive connections for
+HTTP_RETRIES = 3  # retries for connection errors and retryable statuses
+HTTP_RETRY_BACKOFF = 0.3  # seconds, doubled after each retry
+HTTP_RETRY_JITTER = 0.5  # up to this many random seconds per backoff, so workers do not retry in lockstep
+HTTP_RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+# Response cache settings (seconds)
+CACHE_PATH = "~/.cache/hn_summarizer/responses.sqlite3"
+TOP_STORIES_CACHE_TTL = 60
+ITEM_CACHE_TTL = 600
+ARTICLE_CACHE_TTL = 86400
+CACHE_MAX_STALE_AGE = 7 * 86400  # expired entries are kept this long for stale fallback, then purged
+ITEM_LRU_SIZE = 512  # items memoized in-process per HackerNewsAPI
+SUMMARY_LRU_SIZE = 256  # story summaries memoized in-process per HackerNewsSummarizer
+SUMMARY_LRU_TTL = 600  # seconds before a memoized summary is rebuilt
+LLM_CACHE_PATH = "~/.cache/hn_summarizer/llm.sqlite3"
+LLM_CACHE_TTL = 7 * 86400
 
 # Content extraction settings
+MAX_HTML_BYTES = 512 * 1024  # stop downloading article pages past this size
+HTML_CHUNK_SIZE = 32 * 1024
+HTML_CONTENT_TYPES = ("text/html", "application/xhtml+xml")
+TEXT_CONTENT_TYPES = ("text/plain", "text/markdown")  # used as the article text without parsing
+# URLs with these path suffixes are never HTML, so they are skipped without a request
+BINARY_URL_EXTENSIONS = (
+    ".pdf", ".mp4", ".mov", ".webm", ".mp3", ".png", ".jpg", ".jpeg", ".gif", ".webp",
+    ".zip", ".gz", ".tgz", ".dmg", ".exe",
+)
 MAX_CONTENT_LENGTH = 5000
 MIN_SENTENCE_LENGTH = 20
 
@@ -33,7 +65,8 @@ RELATED_LINKS_COUNT = 3
 OLLAMA_BASE_URL = "http://localhost:11434"
 OLLAMA_GENERATE_ENDPOINT = "/api/generate"
 OLLAMA_DEFAULT_MODEL = "qwen3:8b"
-OLLAMA_TIMEOUT = 60
+OLLAMA_TIMEOUT = 60  # seconds to wait for generated output
+OLLAMA_CONNECT_TIMEOUT = 3.05  # seconds to establish a connection
 
 # OpenAI API settings
 OPENAI_API_URL = "https://api.openai.com/v1/chat/completions"
@@ -41,7 +74,12 @@ OPENAI_DEFAULT_MODEL = "gpt-3.5-turbo"
 OPENAI_MAX_TOKENS = 200
 OPENAI_ENHANCED_MAX_TOKENS = 1000
 OPENAI_TEMPERATURE = 0.7
-OPENAI_TIMEOUT = 30
+OPENAI_TIMEOUT = 30  # seconds to wait for generated output
+OPENAI_CONNECT_TIMEOUT = 3.05  # seconds to establish a connection
+OPENAI_RATE_LIMIT = 5  # requests per second, shared by the batch workers
+
+# Page chrome dropped before falling back to the whole <body>
+BOILERPLATE_TAGS = ["nav", "header", "footer", "aside", "form"]
 
 # Content selectors for article extraction
 CONTENT_SELECTORS = [
@@ -2,10 +2,20 @@
 Content fetching functionality for HN Summarizer.
 """
 
-import re
+import codecs
+import logging
+import threading
+import charset_normalizer
+import orjson
 import requests
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
 from typing import List, Optional
-from bs4 import BeautifulSoup
+from urllib.parse import urlparse
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from selectolax.lexbor import LexborHTMLParser
 
 from .config import (
     HN_API_BASE_URL,
@@ -13,23 +23,173 @@ from .config import (
     HN_ITEM_ENDPOINT,
     DEFAULT_USER_AGENT,
     REQUEST_TIMEOUT,
+    HN_API_RATE_LIMIT,
+    ARTICLE_RATE_LIMIT,
+    MAX_FETCH_WORKERS,
+    MAX_EXTRACT_WORKERS,
+    ARTICLE_POOL_HOSTS,
+    HTTP_RETRIES,
+    HTTP_RETRY_BACKOFF,
+    HTTP_RETRY_JITTER,
+    HTTP_RETRY_STATUSES,
     MAX_CONTENT_LENGTH,
+    MAX_HTML_BYTES,
+    HTML_CHUNK_SIZE,
+    HTML_CONTENT_TYPES,
+    TEXT_CONTENT_TYPES,
+    BINARY_URL_EXTENSIONS,
     CONTENT_SELECTORS,
+    BOILERPLATE_TAGS,
+    TOP_STORIES_CACHE_TTL,
+    ITEM_CACHE_TTL,
+    ARTICLE_CACHE_TTL,
+    ITEM_LRU_SIZE,
 )
+from .cache import ResponseCache
+from .ratelimit import HostRateLimiter
 from .models import HNStory, ArticleContent, HNComment
 from .logging_config import get_logger, log_performance
 
 
+def _build_session() -> requests.Session:
+    """Create the HTTP session shared by the HN API client and the content extractor."""
+    session = requests.Session()
+    session.headers.update({"User-Agent": DEFAULT_USER_AGENT})
+    # Articles live on many different hosts, and bulk HN fetches hit one host from
+    # many threads, so keep more host pools and more connections per pool than the default 10
+    # Transient failures (dropped connections, 429s, 5xx) are retried with backoff
+    retries = Retry(
+        total=HTTP_RETRIES,
+        backoff_factor=HTTP_RETRY_BACKOFF,
+        backoff_jitter=HTTP_RETRY_JITTER,
+        status_forcelist=HTTP_RETRY_STATUSES,
+    )
+    adapter = HTTPAdapter(
+        pool_connections=ARTICLE_POOL_HOSTS,
+        pool_maxsize=max(MAX_FETCH_WORKERS, MAX_EXTRACT_WORKERS),
+        max_retries=retries,
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+_SESSION = _build_session()
+# Shared so concurrent clients draw from the same per-host budgets
+_RATE_LIMITER = HostRateLimiter(ARTICLE_RATE_LIMIT, {urlparse(HN_API_BASE_URL).netloc: HN_API_RATE_LIMIT})
+
+
+def _looks_like_html(body: bytes) -> bool:
+    """Sniff whether a page body is markup, since cached bodies carry no Content-Type."""
+    return body.lstrip(b"\xef\xbb\xbf \t\r\n")[:1] == b"<"
+
+
+def _declared_charset(content_type: str) -> Optional[str]:
+    """Return the charset parameter of a Content-Type header, if it names a known codec."""
+    for param in content_type.split(";")[1:]:
+        name, _, value = param.partition("=")
+        if name.strip().lower() == "charset":
+            charset = value.strip().strip("\"'")
+            try:
+                return codecs.lookup(charset).name
+            except LookupError:
+                return None
+    return None
+
+
+def _decode_text(body: bytes) -> str:
+    """Decode a plain text body, detecting its encoding when it is not UTF-8."""
+    try:
+        return body.decode("utf-8")
+    except UnicodeDecodeError:
+        best = charset_normalizer.from_bytes(body).best()
+        return str(best) if best is not None else body.decode("utf-8", errors="replace")
+
+
 class HackerNewsAPI:
     """Client for interacting with the Hacker News API."""
     
-    def __init__(self):
+    def __init__(self, cache: Optional[ResponseCache] = None, session: Optional[requests.Session] = None,
+                 rate_limiter: Optional[HostRateLimiter] = None):
         self.base_url = HN_API_BASE_URL
-        self.session = requests.Session()
-        self.session.headers.update({"User-Agent": DEFAULT_USER_AGENT})
+        self.cache = cache
+        self._items: OrderedDict = OrderedDict()
+        self._items_lock = threading.Lock()
+        self.session = session or _SESSION
+        self.rate_limiter = rate_limiter or _RATE_LIMITER
         self.logger = get_logger(self.__class__.__name__)
         self.logger.debug(f"Initialized HackerNewsAPI with base URL: {self.base_url}")
     
+    def _get_json(self, url: str, ttl: int):
+        """GET a JSON document, consulting the response cache when one is configured."""
+        if self.cache:
+            cached = self.cache.get(url)
+            if cached is not None:
+                if self.logger.isEnabledFor(logging.DEBUG):
+                    self.logger.debug(f"Cache hit for {url}")
+                return orjson.loads(cached)
+        
+        # An expired entry can still be revalidated with the ETag it was served with
+        stale = self.cache.get(url, allow_expired=True) if self.cache else None
+        etag = self.cache.get(f"etag:{url}", allow_expired=True) if stale is not None else None
+        headers = {"If-None-Match": etag} if etag else {}
+        
+        try:
+            self.rate_limiter.wait(url)
+            response = self.session.get(url, headers=headers, timeout=REQUEST_TIMEOUT)
+            response.raise_for_status()
+            if response.status_code == 304:
+                if self.logger.isEnabledFor(logging.DEBUG):
+                    self.logger.debug(f"Not modified: {url}")
+                self.cache.set(url, stale, ttl)
+                return orjson.loads(stale)
+            # orjson parses the raw bytes directly, skipping the text decode response.json() does
+            data = orjson.loads(response.content)
+        except (requests.RequestException, orjson.JSONDecodeError) as e:
+            if stale is None:
+                if isinstance(e, orjson.JSONDecodeError):
+                    # Callers handle RequestException, which is what response.json() raised for bad bodies
+                    raise requests.exceptions.InvalidJSONError(f"Invalid JSON from {url}: {e}") from e
+                raise
+            self.logger.warning(f"Request to {url} failed, using stale cached response")
+            return orjson.loads(stale)
+        
+        if self.cache:
+            self.cache.set(url, orjson.dumps(data), ttl)
+            if response.headers.get("ETag"):
+                self.cache.set(f"etag:{url}", response.headers["ETag"], ttl)
+        return data
+    
+    def _get_item(self, item_id: int):
+        """Fetch an item's JSON, memoized per instance so repeat lookups skip HTTP."""
+        with self._items_lock:
+            if item_id in self._items:
+                self._items.move_to_end(item_id)
+                return self._items[item_id]
+        
+        data = self._get_json(f"{self.base_url}{HN_ITEM_ENDPOINT.format(item_id)}", ITEM_CACHE_TTL)
+        
+        with self._items_lock:
+            self._items[item_id] = data
+            if len(self._items) > ITEM_LRU_SIZE:
+                self._items.popitem(last=False)
+        return data
+    
+    @staticmethod
+    def _build_story(data: dict, story_id: int) -> HNStory:
+        """Build an HNStory from an item's JSON."""
+        return HNStory(
+            id=data.get("id", story_id),
+            title=data.get("title", "No title"),
+            url=data.get("url"),
+            score=data.get("score", 0),
+            by=data.get("by"),
+            time=data.get("time"),
+            descendants=data.get("descendants"),
+            type=data.get("type", "story"),
+            kids=data.get("kids", [])
+        )
+    
     @log_performance(get_logger("HackerNewsAPI.get_top_story_ids"), "fetching top story IDs")
     def get_top_story_ids(self, limit: int = 20) -> List[int]:
         """Fetch top story IDs from Hacker News API."""
@@ -37,13 +197,12 @@ class HackerNewsAPI:
         self.logger.debug(f"Fetching top story IDs from: {url}")
         
         try:
-            response = self.session.get(url, timeout=REQUEST_TIMEOUT)
-            response.raise_for_status()
-            all_story_ids = response.json()
+            all_story_ids = self._get_json(url, TOP_STORIES_CACHE_TTL)
             story_ids = all_story_ids[:limit]
             
             self.logger.info(f"Successfully fetched {len(story_ids)} story IDs (out of {len(all_story_ids)} available)")
-            self.logger.debug(f"Story IDs: {story_ids[:5]}{'...' if len(story_ids) > 5 else ''}")
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug(f"Story IDs: {story_ids[:5]}{'...' if len(story_ids) > 5 else ''}")
             return story_ids
             
         except requests.RequestException as e:
@@ -52,48 +211,64 @@ class HackerNewsAPI:
     
     def get_story_details(self, story_id: int) -> Optional[HNStory]:
         """Fetch details for a specific story."""
-        url = f"{self.base_url}{HN_ITEM_ENDPOINT.format(story_id)}"
-        self.logger.debug(f"Fetching story details for {story_id} from: {url}")
+        # Called once per story from worker threads, so skip building debug messages nobody sees
+        debug = self.logger.isEnabledFor(logging.DEBUG)
+        if debug:
+            url = f"{self.base_url}{HN_ITEM_ENDPOINT.format(story_id)}"
+            self.logger.debug(f"Fetching story details for {story_id} from: {url}")
         
         try:
-            response = self.session.get(url, timeout=REQUEST_TIMEOUT)
-            response.raise_for_status()
-            
-            data = response.json()
+            data = self._get_item(story_id)
             if not data:
                 self.logger.warning(f"Empty response for story {story_id}")
                 return None
                 
-            story = HNStory(
-                id=data.get("id", story_id),
-                title=data.get("title", "No title"),
-                url=data.get("url"),
-                score=data.get("score", 0),
-                by=data.get("by"),
-                time=data.get("time"),
-                descendants=data.get("descendants"),
-                type=data.get("type", "story")
-            )
+            story = self._build_story(data, story_id)
             
-            self.logger.debug(f"Successfully fetched story {story_id}: '{story.title[:50]}...', score: {story.score}")
+            if debug:
+                self.logger.debug(f"Successfully fetched story {story_id}: '{story.title[:50]}...', score: {story.score}")
             return story
             
         except requests.RequestException as e:
             self.logger.error(f"Failed to fetch story {story_id}: {e}")
             return None
     
+    @log_performance(get_logger("HackerNewsAPI.get_stories_bulk"), "bulk story fetch")
+    def get_stories_bulk(self, story_ids: List[int]) -> List[Optional[HNStory]]:
+        """Fetch details for several stories concurrently, preserving input order."""
+        if not story_ids:
+            return []
+        
+        workers = min(MAX_FETCH_WORKERS, len(story_ids))
+        self.logger.debug(f"Fetching {len(story_ids)} stories with {workers} workers")
+        
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            stories = list(executor.map(self._story_or_none, story_ids))
+        
+        fetched = sum(1 for story in stories if story)
+        self.logger.info(f"Fetched {fetched}/{len(story_ids)} stories")
+        return stories
+    
+    def _story_or_none(self, story_id: int) -> Optional[HNStory]:
+        """get_story_details for bulk workers, so an unexpected error only costs that story."""
+        try:
+            return self.get_story_details(story_id)
+        except Exception as e:
+            self.logger.error(f"Failed to fetch story {story_id}: {e}", exc_info=True)
+            return None
+    
     def get_comment(self, comment_id: int) -> Optional[HNComment]:
         """Fetch details for a specific comment."""
-        url = f"{self.base_url}{HN_ITEM_ENDPOINT.format(comment_id)}"
-        self.logger.debug(f"Fetching comment {comment_id} from: {url}")
+        debug = self.logger.isEnabledFor(logging.DEBUG)
+        if debug:
+            url = f"{self.base_url}{HN_ITEM_ENDPOINT.format(comment_id)}"
+            self.logger.debug(f"Fetching comment {comment_id} from: {url}")
         
         try:
-            response = self.session.get(url, timeout=REQUEST_TIMEOUT)
-            response.raise_for_status()
-            
-            data = response.json()
+            data = self._get_item(comment_id)
             if not data or data.get("type") != "comment":
-                self.logger.debug(f"Invalid or non-comment data for {comment_id}")
+                if debug:
+                    self.logger.debug(f"Invalid or non-comment data for {comment_id}")
                 return None
                 
             comment = HNComment(
@@ -105,86 +280,97 @@ class HackerNewsAPI:
                 kids=data.get("kids", [])
             )
             
-            self.logger.debug(f"Fetched comment {comment_id} by {comment.by}, {len(comment.text)} chars")
+            if debug:
+                self.logger.debug(f"Fetched comment {comment_id} by {comment.by}, {len(comment.text)} chars")
             return comment
             
         except requests.RequestException as e:
             self.logger.error(f"Failed to fetch comment {comment_id}: {e}")
             return None
     
-    def get_top_comments(self, story: HNStory, max_comments: int = 20) -> List[HNComment]:
-        """Fetch top-level comments for a story."""
-        comments = []
+    @log_performance(get_logger("HackerNewsAPI.get_comments_bulk"), "bulk comment fetch")
+    def get_comments_bulk(self, comment_ids: List[int]) -> List[HNComment]:
+        """Fetch several comments concurrently, keeping non-empty ones in input order."""
+        # Only include non-empty comments
+        return [comment for comment in self._fetch_comments(comment_ids) if comment and comment.text.strip()]
+    
+    def _fetch_comments(self, comment_ids: List[int]) -> List[Optional[HNComment]]:
+        """Fetch several comments concurrently, returning None for missing ones, in input order."""
+        if not comment_ids:
+            return []
         
-        if not story.descendants or not hasattr(story, 'kids'):
-            # Need to fetch story details to get comment IDs
-            story_details = self.get_story_details(story.id)
-            if not story_details or 'kids' not in story_details.__dict__:
-                return comments
-            comment_ids = getattr(story_details, 'kids', [])
-        else:
-            comment_ids = getattr(story, 'kids', [])
+        workers = min(MAX_FETCH_WORKERS, len(comment_ids))
+        self.logger.debug(f"Fetching {len(comment_ids)} comments with {workers} workers")
         
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(self._comment_or_none, comment_ids))
+    
+    def _comment_or_none(self, comment_id: int) -> Optional[HNComment]:
+        """get_comment for bulk workers, so an unexpected error only costs that comment."""
+        try:
+            return self.get_comment(comment_id)
+        except Exception as e:
+            self.logger.error(f"Failed to fetch comment {comment_id}: {e}", exc_info=True)
+            return None
+    
+    def _comment_ids(self, story: HNStory) -> List[int]:
+        """Return a story's top-level comment IDs, looking them up if the story lacks item data."""
+        if story.kids is not None:
+            return story.kids
+        story_details = self.get_story_details(story.id)
+        return (story_details.kids or []) if story_details else []
+    
+    def get_top_comments(self, story: HNStory, max_comments: int = 20) -> List[HNComment]:
+        """Fetch top-level comments for a story."""
         # Fetch comments up to max_comments limit
-        for comment_id in comment_ids[:max_comments]:
-            comment = self.get_comment(comment_id)
-            if comment and comment.text.strip():  # Only include non-empty comments
-                comments.append(comment)
-                
-        return comments
+        return self.get_comments_bulk(self._comment_ids(story)[:max_comments])
+    
+    def get_top_comments_bulk(self, stories: List[HNStory], max_comments: int = 20) -> List[List[HNComment]]:
+        """Fetch top-level comments for several stories in one concurrent pass, in story order."""
+        id_lists = [self._comment_ids(story)[:max_comments] for story in stories]
+        fetched = iter(self._fetch_comments([comment_id for ids in id_lists for comment_id in ids]))
+        return [
+            [comment for comment in islice(fetched, len(ids)) if comment and comment.text.strip()]
+            for ids in id_lists
+        ]
     
     def get_story_with_comments(self, story_id: int, max_comments: int = 20) -> Optional[tuple]:
         """Fetch story with its top comments."""
         try:
             # Get story details first
-            url = f"{self.base_url}{HN_ITEM_ENDPOINT.format(story_id)}"
-            response = self.session.get(url, timeout=REQUEST_TIMEOUT)
-            response.raise_for_status()
-            
-            data = response.json()
+            data = self._get_item(story_id)
             if not data:
                 return None
                 
-            story = HNStory(
-                id=data.get("id", story_id),
-                title=data.get("title", "No title"),
-                url=data.get("url"),
-                score=data.get("score", 0),
-                by=data.get("by"),
-                time=data.get("time"),
-                descendants=data.get("descendants"),
-                type=data.get("type", "story")
-            )
+            story = self._build_story(data, story_id)
             
             # Fetch comments
-            comments = []
-            comment_ids = data.get("kids", [])
-            
-            for comment_id in comment_ids[:max_comments]:
-                comment = self.get_comment(comment_id)
-                if comment and comment.text.strip():
-                    comments.append(comment)
+            comments = self.get_comments_bulk(story.kids[:max_comments])
             
             return story, comments
             
         except requests.RequestException as e:
-            print(f"Error fetching story with comments {story_id}: {e}")
+            self.logger.error(f"Failed to fetch story {story_id} with comments: {e}")
             return None
 
 
 class ContentExtractor:
     """Extracts article content from web pages."""
     
-    def __init__(self):
-        self.session = requests.Session()
-        self.session.headers.update({"User-Agent": DEFAULT_USER_AGENT})
+    def __init__(self, cache: Optional[ResponseCache] = None, session: Optional[requests.Session] = None,
+                 rate_limiter: Optional[HostRateLimiter] = None):
+        self.cache = cache
+        self.session = session or _SESSION
+        self.rate_limiter = rate_limiter or _RATE_LIMITER
         self.logger = get_logger(self.__class__.__name__)
         self.logger.debug("Initialized ContentExtractor")
     
     @log_performance(get_logger("ContentExtractor.extract_content"), "content extraction")
     def extract_content(self, story: HNStory) -> ArticleContent:
         """Extract article content from a story's URL."""
-        self.logger.debug(f"Extracting content for story {story.id}: '{story.title[:50]}...'")
+        debug = self.logger.isEnabledFor(logging.DEBUG)
+        if debug:
+            self.logger.debug(f"Extracting content for story {story.id}: '{story.title[:50]}...'")
         
         if not story.url:
             self.logger.warning(f"No URL available for story {story.id}")
@@ -196,34 +382,57 @@ class ContentExtractor:
                 error_message="No URL available"
             )
         
-        self.logger.debug(f"Fetching content from URL: {story.url}")
+        if urlparse(story.url).path.lower().endswith(BINARY_URL_EXTENSIONS):
+            self.logger.info(f"Skipping non-HTML URL {story.url}")
+            return ArticleContent(
+                title=story.title,
+                content="",
+                url=story.url,
+                extracted_successfully=False,
+                error_message="Non-HTML content"
+            )
+        
+        # Extracted text is cached separately so repeat runs skip parsing as well as the download
+        text_key = f"text:{story.url}"
+        if self.cache:
+            cached = self.cache.get(text_key)
+            if cached is not None:
+                if debug:
+                    self.logger.debug(f"Extracted text cache hit for {story.url}")
+                return ArticleContent(
+                    title=story.title,
+                    content=cached,
+                    url=story.url,
+                    extracted_successfully=True
+                )
+        
+        if debug:
+            self.logger.debug(f"Fetching content from URL: {story.url}")
         
         try:
-            response = self.session.get(story.url, timeout=REQUEST_TIMEOUT)
-            response.raise_for_status()
-            
-            self.logger.debug(f"Successfully fetched {len(response.content)} bytes from {story.url}")
-            
-            soup = BeautifulSoup(response.content, "html.parser")
-            
-            # Remove script and style elements
-            removed_elements = len(soup(["script", "style"]))
-            for element in soup(["script", "style"]):
-                element.extract()
-            self.logger.debug(f"Removed {removed_elements} script/style elements")
+            page = self._fetch_page(story.url)
+            if page is None:
+                return ArticleContent(
+                    title=story.title,
+                    content="",
+                    url=story.url,
+                    extracted_successfully=False,
+                    error_message="Non-HTML content"
+                )
             
-            # Try to find main content using selectors
-            content = self._extract_main_content(soup)
-            
-            # Fallback to body if no main content found
-            if not content:
-                self.logger.debug("Main content not found, falling back to body extraction")
-                content = self._extract_body_content(soup)
+            if _looks_like_html(page):
+                content = self._extract_html_text(page)
+            else:
+                # Plain text and markdown are already the article text, so skip parsing
+                if debug:
+                    self.logger.debug(f"Using plain text body of {story.url} as is")
+                content = _decode_text(page)
             
             # Clean up text
             original_length = len(content)
             content = self._clean_content(content)
-            self.logger.debug(f"Cleaned content: {original_length} -> {len(content)} characters")
+            if debug:
+                self.logger.debug(f"Cleaned content: {original_length} -> {len(content)} characters")
             
             result = ArticleContent(
                 title=story.title,
@@ -231,6 +440,8 @@ class ContentExtractor:
                 url=story.url,
                 extracted_successfully=True
             )
+            if self.cache:
+                self.cache.set(text_key, content, ARTICLE_CACHE_TTL)
             
             self.logger.info(f"Successfully extracted {len(content)} characters from {story.url}")
             return result
@@ -245,23 +456,116 @@ class ContentExtractor:
                 error_message=str(e)
             )
     
-    def _extract_main_content(self, soup: BeautifulSoup) -> str:
+    @log_performance(get_logger("ContentExtractor.extract_many"), "bulk content extraction")
+    def extract_many(self, stories: List[HNStory]) -> List[ArticleContent]:
+        """Extract content for several stories concurrently, preserving input order."""
+        if not stories:
+            return []
+        
+        workers = min(MAX_EXTRACT_WORKERS, len(stories))
+        self.logger.debug(f"Extracting content for {len(stories)} stories with {workers} workers")
+        
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(self.extract_content, stories))
+    
+    def _fetch_page(self, url: str) -> Optional[bytes]:
+        """
+        Download a page body, consulting the response cache when one is configured.
+        
+        Returns:
+            The HTML or plain text bytes, or None if the URL serves anything else
+        """
+        if self.cache:
+            cached = self.cache.get(url)
+            if cached is not None:
+                if self.logger.isEnabledFor(logging.DEBUG):
+                    self.logger.debug(f"Cache hit for {url}")
+                # An empty entry records a non-HTML URL
+                return cached or None
+        
+        try:
+            self.rate_limiter.wait(url)
+            response = self.session.get(url, timeout=REQUEST_TIMEOUT, stream=True)
+            try:
+                response.raise_for_status()
+                # Headers arrive before the body, so PDFs, videos etc. are skipped unread
+                content_type = response.headers.get("Content-Type", "")
+                if content_type and not content_type.startswith(HTML_CONTENT_TYPES + TEXT_CONTENT_TYPES):
+                    self.logger.info(f"Skipping non-HTML content ({content_type}) at {url}")
+                    body = b""
+                else:
+                    body = self._read_body(response)
+                    # Cached bodies carry no headers, so text in a declared charset is stored as UTF-8
+                    charset = _declared_charset(content_type)
+                    if content_type.startswith(TEXT_CONTENT_TYPES) and charset not in (None, "utf-8"):
+                        body = body.decode(charset, errors="replace").encode("utf-8")
+            finally:
+                response.close()
+        except requests.RequestException:
+            stale = self.cache.get(url, allow_expired=True) if self.cache else None
+            if stale is None:
+                raise
+            self.logger.warning(f"Request to {url} failed, using stale cached page")
+            return stale or None
+        
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug(f"Successfully fetched {len(body)} bytes from {url}")
+        if self.cache:
+            self.cache.set(url, body, ARTICLE_CACHE_TTL)
+        return body or None
+    
+    def _read_body(self, response: requests.Response) -> bytes:
+        """Read a streamed response body, stopping once MAX_HTML_BYTES have arrived."""
+        chunks = []
+        size = 0
+        for chunk in response.iter_content(chunk_size=HTML_CHUNK_SIZE):
+            chunks.append(chunk)
+            size += len(chunk)
+            if size >= MAX_HTML_BYTES:
+                self.logger.debug(f"Stopped reading {response.url} after {size} bytes")
+                break
+        return b"".join(chunks)[:MAX_HTML_BYTES]
+    
+    def _extract_html_text(self, html: bytes) -> str:
+        """Parse an HTML page and return the text of its main content."""
+        # encoding=True lets lexbor detect the charset from the bytes and meta tags
+        tree = LexborHTMLParser(html, encoding=True)
+        
+        # Remove script and style elements
+        tree.strip_tags(["script", "style"])
+        
+        # Try to find main content using selectors
+        content = self._extract_main_content(tree)
+        
+        # Fallback to body if no main content found
+        if not content:
+            self.logger.debug("Main content not found, falling back to body extraction")
+            content = self._extract_body_content(tree)
+        return content
+    
+    def _extract_main_content(self, tree: LexborHTMLParser) -> str:
         """Try to extract main content using content selectors."""
+        # Text nodes are joined with a space so adjacent blocks don't run together;
+        # _clean_content collapses the extra whitespace
+        # Selectors are tried one at a time so their priority order is kept
         for selector in CONTENT_SELECTORS:
-            elements = soup.select(selector)
-            if elements:
-                return elements[0].get_text()
+            node = tree.css_first(selector)
+            if node:
+                return node.text(separator=" ")
         return ""
     
-    def _extract_body_content(self, soup: BeautifulSoup) -> str:
-        """Fallback to extracting content from body."""
-        if soup.body:
-            return soup.body.get_text()
-        return soup.get_text()
+    def _extract_body_content(self, tree: LexborHTMLParser) -> str:
+        """Fallback to extracting content from body, minus navigation and other page chrome."""
+        tree.strip_tags(BOILERPLATE_TAGS)
+        node = tree.body or tree.root
+        return node.text(separator=" ") if node else ""
     
     def _clean_content(self, content: str) -> str:
         """Clean and normalize extracted content."""
-        # Remove extra whitespace
-        content = re.sub(r'\s+', ' ', content).strip()
-        # Limit content length
-        return content[:MAX_CONTENT_LENGTH]
\ No newline at end of file
+        # Only normalize a bounded prefix; page text is mostly far longer than we keep
+        window = MAX_CONTENT_LENGTH * 4
+        cleaned = " ".join(content[:window].split())
+        if len(cleaned) < MAX_CONTENT_LENGTH and len(content) > window:
+            # The prefix was mostly whitespace, so normalize everything
+            cleaned = " ".join(content.split())
+        return cleaned[:MAX_CONTENT_LENGTH]
\ No newline at end of file
@@ -0,0 +1,36 @@
+"""
+Caching of LLM responses for HN Summarizer.
+"""
+
+import hashlib
+from typing import Optional
+
+from .cache import ResponseCache
+from .config import LLM_CACHE_PATH, LLM_CACHE_TTL
+from .logging_config import get_logger
+
+
+class LLMCache:
+    """Exact-match cache of raw LLM responses keyed by model and prompt."""
+
+    def __init__(self, store: Optional[ResponseCache] = None, ttl: float = LLM_CACHE_TTL):
+        # Expired responses are never served, so they are purged as soon as the cache is reopened
+        self.store = store or ResponseCache(LLM_CACHE_PATH, max_stale_age=0)
+        self.ttl = ttl
+        self.logger = get_logger(self.__class__.__name__)
+
+    @staticmethod
+    def make_key(model: str, prompt: str) -> str:
+        """Build the cache key; the prompt already embeds the article content."""
+        return hashlib.sha256(f"{model}\n{prompt}".encode()).hexdigest()
+
+    def get(self, model: str, prompt: str) -> Optional[str]:
+        """Return the cached response for this model and prompt, if any."""
+        response = self.store.get(self.make_key(model, prompt))
+        if response is not None:
+            self.logger.debug(f"LLM cache hit for model {model} ({len(prompt)} char prompt)")
+        return response
+
+    def set(self, model: str, prompt: str, response: str) -> None:
+        """Store a response for this model and prompt."""
+        self.store.set(self.make_key(model, prompt), response, self.ttl)
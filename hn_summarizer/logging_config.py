@@ -2,10 +2,18 @@
 Logging configuration for HN Summarizer.
 """
 
+import atexit
 import logging
+import logging.handlers
+import queue
 import sys
+import time
+from functools import wraps
 from typing import Optional
 
+# Writes log records to the real handlers on a background thread
+_listener: Optional[logging.handlers.QueueListener] = None
+
 
 def setup_logging(level: str = "INFO", log_file: Optional[str] = None) -> None:
     """
@@ -37,10 +45,18 @@ def setup_logging(level: str = "INFO", log_file: Optional[str] = None) -> None:
         file_handler.setFormatter(formatter)
         handlers.append(file_handler)
     
+    # QueueHandler still formats each message (and traceback) on the calling thread,
+    # but writing happens on the listener thread, so workers never block on stderr or disk
+    global _listener
+    stop_logging()
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    _listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+    _listener.start()
+    
     # Configure root logger
     logging.basicConfig(
         level=log_level,
-        handlers=handlers,
+        handlers=[logging.handlers.QueueHandler(log_queue)],
         force=True  # Override any existing configuration
     )
     
@@ -49,31 +65,48 @@ def setup_logging(level: str = "INFO", log_file: Optional[str] = None) -> None:
     logging.getLogger("urllib3").setLevel(logging.WARNING)
 
 
+def stop_logging() -> None:
+    """Flush queued log records and stop the background logging thread."""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        for handler in _listener.handlers:
+            handler.close()
+        _listener = None
+
+
+atexit.register(stop_logging)
+
+
 def get_logger(name: str) -> logging.Logger:
     """Get a logger instance for the given name."""
     return logging.getLogger(name)
 
 
 # Performance timing decorator
-import time
-from functools import wraps
-
-
 def log_performance(logger: logging.Logger, operation: str):
     """Decorator to log performance timing for functions."""
     def decorator(func):
         @wraps(func)
         def wrapper(*args, **kwargs):
-            start_time = time.time()
+            # Timings are only reported at INFO, so skip measuring when they would be dropped
+            if not logger.isEnabledFor(logging.INFO):
+                try:
+                    return func(*args, **kwargs)
+                except Exception as e:
+                    logger.error(f"Failed {operation}: {e}")
+                    raise
+            
+            start_time = time.perf_counter()
             logger.debug(f"Starting {operation}")
             
             try:
                 result = func(*args, **kwargs)
-                duration = time.time() - start_time
+                duration = time.perf_counter() - start_time
                 logger.info(f"Completed {operation} in {duration:.2f}s")
                 return result
             except Exception as e:
-                duration = time.time() - start_time
+                duration = time.perf_counter() - start_time
                 logger.error(f"Failed {operation} after {duration:.2f}s: {e}")
                 raise
         return wrapper
@@ -14,7 +14,7 @@ class SummarizerMode(Enum):
     LLMAPI = "llmapi"
 
 
-@dataclass
+@dataclass(slots=True)
 class HNStory:
     """Represents a Hacker News story."""
     id: int
@@ -25,9 +25,10 @@ class HNStory:
     time: Optional[int] = None
     descendants: Optional[int] = None
     type: str = "story"
+    kids: Optional[List[int]] = None
 
 
-@dataclass 
+@dataclass(slots=True)
 class ArticleContent:
     """Represents extracted article content."""
     title: str
@@ -37,7 +38,7 @@ class ArticleContent:
     error_message: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class HNComment:
     """Represents a Hacker News comment."""
     id: int
@@ -48,7 +49,7 @@ class HNComment:
     kids: Optional[List[int]] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class EnhancedSummary:
     """Enhanced summary with article content, comments, and related links."""
     article_summary: str
@@ -57,9 +58,10 @@ class EnhancedSummary:
     related_links: List[str]
     original_url: str
     hn_discussion_url: str
+    fallback_used: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class ArticleSummary:
     """Represents a summarized article."""
     story: HNStory
@@ -71,13 +73,14 @@ class ArticleSummary:
     fallback_used: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class SummarizerConfig:
     """Configuration for a summarizer."""
     mode: SummarizerMode
-    timeout: int = 60
+    timeout: Optional[int] = None  # seconds; None uses the summarizer's own default
     max_tokens: Optional[int] = None
     temperature: Optional[float] = None
     model_name: Optional[str] = None
     ollama_model: Optional[str] = None
-    allow_fallback: bool = True
\ No newline at end of file
+    allow_fallback: bool = True
+    use_cache: bool = False
\ No newline at end of file
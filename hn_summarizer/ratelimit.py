@@ -0,0 +1,48 @@
+"""
+Per-host request rate limiting for HN Summarizer.
+"""
+
+import threading
+import time
+from typing import Dict, Optional, Tuple
+from urllib.parse import urlparse
+
+
+class HostRateLimiter:
+    """Thread-safe token bucket per host, so a slow site never throttles another."""
+
+    def __init__(self, rate: float, host_rates: Optional[Dict[str, float]] = None):
+        """
+        Args:
+            rate: Requests per second allowed for hosts without an override
+            host_rates: Requests per second for specific hosts
+        """
+        self.rate = rate
+        self.host_rates = host_rates or {}
+        self._lock = threading.Lock()
+        # host -> (available tokens, time of last update); tokens go negative for queued requests
+        self._buckets: Dict[str, Tuple[float, float]] = {}
+
+    def wait(self, url: str) -> float:
+        """
+        Block until a request to url's host is allowed.
+
+        Returns:
+            The number of seconds spent waiting
+        """
+        host = urlparse(url).netloc
+        rate = self.host_rates.get(host, self.rate)
+        # Up to one second's worth of requests may go out back to back
+        capacity = max(1.0, rate)
+
+        with self._lock:
+            now = time.monotonic()
+            tokens, updated = self._buckets.get(host, (capacity, now))
+            tokens = min(capacity, tokens + (now - updated) * rate) - 1
+            self._buckets[host] = (tokens, now)
+
+        # Sleep outside the lock; the token is already reserved
+        delay = -tokens / rate if tokens < 0 else 0.0
+        if delay:
+            time.sleep(delay)
+        return delay
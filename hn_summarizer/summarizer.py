@@ -2,49 +2,56 @@
 Core functionality for fetching and summarizing Hacker News articles
 """
 
+import logging
 import time
-from typing import List, Dict
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Optional, Tuple
 
-from .config import RATE_LIMIT_DELAY
-from .models import SummarizerMode, SummarizerConfig, ArticleSummary, EnhancedSummary
+from .cache import ResponseCache
+from .models import SummarizerMode, SummarizerConfig, ArticleSummary, EnhancedSummary, HNStory, ArticleContent
 from .fetchers import HackerNewsAPI, ContentExtractor
 from .summarizers import BasicSummarizer, OllamaSummarizer, LLMAPISummarizer
-from .config import MAX_COMMENTS_TO_FETCH
+from .config import MAX_COMMENTS_TO_FETCH, SUMMARY_LRU_SIZE, SUMMARY_LRU_TTL
 from .logging_config import get_logger, log_performance
 
+# SummarizerMode(mode) already rejects unknown modes, so every member needs an entry here
+_SUMMARIZER_REGISTRY = {
+    SummarizerMode.BASIC: BasicSummarizer,
+    SummarizerMode.OLLAMA: OllamaSummarizer,
+    SummarizerMode.LLMAPI: LLMAPISummarizer,
+}
+
 
 class HackerNewsSummarizer:
     """Main class for fetching and summarizing Hacker News articles"""
 
-    def __init__(self, mode: str = "basic", ollama_model: str = None, allow_fallback: bool = True):
+    def __init__(self, mode: str = "basic", ollama_model: str = None, allow_fallback: bool = True,
+                 use_cache: bool = False):
         self.mode = SummarizerMode(mode)
         self.ollama_model = ollama_model
         self.allow_fallback = allow_fallback
         self.logger = get_logger(self.__class__.__name__)
         
         self.logger.debug(f"Initializing HackerNewsSummarizer with mode: {mode}")
-        self.api_client = HackerNewsAPI()
-        self.content_extractor = ContentExtractor()
+        self.cache = ResponseCache() if use_cache else None
+        self.api_client = HackerNewsAPI(cache=self.cache)
+        self.content_extractor = ContentExtractor(cache=self.cache)
         self.summarizer = self._create_summarizer()
+        # story_id -> (monotonic time stored, result), most recently used last
+        self._summaries: OrderedDict = OrderedDict()
         self.logger.info(f"HackerNewsSummarizer initialized successfully with {self.mode.value} mode")
 
     def _create_summarizer(self):
         """Create appropriate summarizer based on mode."""
-        config = SummarizerConfig(mode=self.mode, ollama_model=self.ollama_model, allow_fallback=self.allow_fallback)
+        config = SummarizerConfig(mode=self.mode, ollama_model=self.ollama_model, allow_fallback=self.allow_fallback,
+                                  use_cache=self.cache is not None)
         
         self.logger.debug(f"Creating summarizer for mode: {self.mode.value}")
         
-        if self.mode == SummarizerMode.BASIC:
-            summarizer = BasicSummarizer(config)
-        elif self.mode == SummarizerMode.OLLAMA:
-            summarizer = OllamaSummarizer(config)
+        summarizer = _SUMMARIZER_REGISTRY[self.mode](config)
+        if self.mode == SummarizerMode.OLLAMA:
             self.logger.debug(f"Using Ollama model: {config.ollama_model or 'default'}")
-        elif self.mode == SummarizerMode.LLMAPI:
-            summarizer = LLMAPISummarizer(config)
-        else:
-            # Fallback to basic
-            self.logger.warning(f"Unknown mode {self.mode}, falling back to basic")
-            summarizer = BasicSummarizer(config)
         
         self.logger.debug(f"Summarizer created: {summarizer.__class__.__name__}")
         return summarizer
@@ -59,119 +66,257 @@ class HackerNewsSummarizer:
 
     def get_story_details(self, story_id: int):
         """Fetch details for a specific story"""
-        self.logger.debug(f"Fetching details for story {story_id}")
+        debug = self.logger.isEnabledFor(logging.DEBUG)
+        if debug:
+            self.logger.debug(f"Fetching details for story {story_id}")
         story = self.api_client.get_story_details(story_id)
         if story:
-            self.logger.debug(f"Retrieved story: {story.title[:50]}...")
+            if debug:
+                self.logger.debug(f"Retrieved story: {story.title[:50]}...")
         else:
             self.logger.warning(f"Failed to retrieve story {story_id}")
         return story
 
+    def get_stories_bulk(self, story_ids: List[int]):
+        """Fetch details for several stories concurrently"""
+        self.logger.debug(f"Fetching details for {len(story_ids)} stories")
+        stories = self.api_client.get_stories_bulk(story_ids)
+        missing = [sid for sid, story in zip(story_ids, stories) if not story]
+        if missing:
+            self.logger.warning(f"Failed to retrieve stories: {missing}")
+        return stories
+
     def extract_article_content(self, story):
         """Extract article content from story"""
-        self.logger.debug(f"Extracting content for story {story.id}: {story.title[:50]}...")
+        debug = self.logger.isEnabledFor(logging.DEBUG)
+        if debug:
+            self.logger.debug(f"Extracting content for story {story.id}: {story.title[:50]}...")
         content = self.content_extractor.extract_content(story)
         if content.extracted_successfully:
-            self.logger.debug(f"Successfully extracted {len(content.content)} characters of content")
+            if debug:
+                self.logger.debug(f"Successfully extracted {len(content.content)} characters of content")
         else:
             self.logger.warning(f"Failed to extract content: {content.error_message}")
         return content
 
+    def extract_articles_content(self, stories):
+        """Extract article content for several stories concurrently"""
+        self.logger.debug(f"Extracting content for {len(stories)} stories")
+        contents = self.content_extractor.extract_many(stories)
+        failed = sum(1 for content in contents if not content.extracted_successfully)
+        if failed:
+            self.logger.warning(f"Failed to extract content for {failed}/{len(stories)} stories")
+        return contents
+
     def generate_summary(self, content) -> List[str]:
         """Generate a summary using the configured summarizer"""
-        self.logger.debug(f"Generating summary using {self.summarizer.__class__.__name__}")
+        debug = self.logger.isEnabledFor(logging.DEBUG)
+        if debug:
+            self.logger.debug(f"Generating summary using {self.summarizer.__class__.__name__}")
         summary = self.summarizer.summarize(content)
-        self.logger.debug(f"Generated {len(summary)} summary lines")
+        if debug:
+            self.logger.debug(f"Generated {len(summary)} summary lines")
         return summary
 
     @log_performance(get_logger("HackerNewsSummarizer.summarize_articles"), "article summarization")
     def summarize_articles(self, limit: int = 20) -> List[Dict]:
         """Main method to fetch and summarize articles"""
         self.logger.info(f"Starting summarization of {limit} articles using {self.mode.value} mode")
-        results: List[Dict] = []
-        successful_articles = 0
-        failed_articles = 0
 
         story_ids = self.get_top_stories(limit)
         if not story_ids:
             self.logger.error("No story IDs retrieved from HN API")
-            return results
+            return []
         
         self.logger.info(f"Processing {len(story_ids)} stories")
 
+        # Stories summarized recently by this instance are reused as they are
+        cached = {}
+        for story_id in story_ids:
+            result = self._get_cached_summary(story_id)
+            if result is not None:
+                cached[story_id] = result
+        pending_ids = [story_id for story_id in story_ids if story_id not in cached]
+        if cached:
+            self.logger.info(f"Reusing {len(cached)} recent summaries")
+
+        if not pending_ids:
+            results, successful_articles, failed_articles = [], 0, 0
+        elif self.mode in [SummarizerMode.OLLAMA, SummarizerMode.LLMAPI]:
+            results, successful_articles, failed_articles = self._summarize_enhanced(pending_ids)
+        else:
+            results, successful_articles, failed_articles = self._summarize_basic(pending_ids)
+
+        for result in results:
+            # Fallback summaries stand in for an unavailable LLM, so the next run should retry it
+            if not (result["enhanced"] and result["enhanced"].fallback_used):
+                self._cache_summary(result)
+        by_id = {result["id"]: result for result in results}
+        by_id.update(cached)
+
+        self.logger.info(f"Summarization complete: {successful_articles} successful, {failed_articles} failed")
+        return [by_id[story_id] for story_id in story_ids if story_id in by_id]
+
+    def _get_cached_summary(self, story_id: int) -> Optional[Dict]:
+        """Return this instance's summary of a story if it is younger than SUMMARY_LRU_TTL."""
+        entry = self._summaries.get(story_id)
+        if entry is None:
+            return None
+        stored_at, result = entry
+        if time.monotonic() - stored_at > SUMMARY_LRU_TTL:
+            # Let score changes and edits through once the entry is stale
+            del self._summaries[story_id]
+            return None
+        self._summaries.move_to_end(story_id)
+        return result
+
+    def _cache_summary(self, result: Dict) -> None:
+        """Remember a story's summary, evicting the least recently used beyond SUMMARY_LRU_SIZE."""
+        self._summaries[result["id"]] = (time.monotonic(), result)
+        self._summaries.move_to_end(result["id"])
+        if len(self._summaries) > SUMMARY_LRU_SIZE:
+            self._summaries.popitem(last=False)
+
+    def _summarize_basic(self, story_ids: List[int]) -> Tuple[List[Dict], int, int]:
+        """
+        Fetch stories and their articles, then summarize each one locally.
+        
+        Returns:
+            Tuple of (results, successful count, failed count)
+        """
+        results: List[Dict] = []
+        successful_articles = 0
+        failed_articles = 0
+
+        # Fetch all stories and articles up front in parallel
+        basic_stories, basic_contents = self._fetch_stories_and_contents(story_ids)
+        debug = self.logger.isEnabledFor(logging.DEBUG)
+
         for i, story_id in enumerate(story_ids, 1):
             self.logger.info(f"Processing story {i}/{len(story_ids)}: {story_id}")
-            print(f"Processing story {i}/{limit}: {story_id}")
             
             article_start_time = time.time()
 
             try:
-                # For enhanced modes (ollama/llmapi), get story with comments
-                if self.mode in [SummarizerMode.OLLAMA, SummarizerMode.LLMAPI]:
-                    self.logger.debug(f"Fetching story {story_id} with comments for enhanced mode")
-                    story_with_comments = self.api_client.get_story_with_comments(
-                        story_id, MAX_COMMENTS_TO_FETCH
-                    )
-                    if not story_with_comments:
-                        self.logger.warning(f"Failed to fetch story {story_id} with comments")
-                        failed_articles += 1
-                        continue
-                
-                    story, comments = story_with_comments
-                    self.logger.debug(f"Story {story_id} has {len(comments)} comments")
-                    content = self.extract_article_content(story)
-                    
-                    # Generate enhanced summary
-                    if hasattr(self.summarizer, 'enhanced_summarize'):
-                        self.logger.debug(f"Generating enhanced summary for story {story_id}")
-                        enhanced_summary = self.summarizer.enhanced_summarize(content, comments, story_id)
-                        summary_lines = self._format_enhanced_summary_for_output(enhanced_summary)
-                    else:
-                        summary_lines = self.generate_summary(content)
-                    
-                    results.append({
-                        "id": story.id,
-                        "title": story.title,
-                        "url": story.url or "",
-                        "score": story.score,
-                        "summary": summary_lines,
-                        "enhanced": enhanced_summary if hasattr(self.summarizer, 'enhanced_summarize') else None
-                    })
-                else:
-                    # Basic mode - use original logic
-                    self.logger.debug(f"Processing story {story_id} in basic mode")
-                    story = self.get_story_details(story_id)
-                    if not story:
-                        self.logger.warning(f"Failed to fetch story {story_id}")
-                        failed_articles += 1
-                        continue
-
-                    content = self.extract_article_content(story)
-                    summary_lines = self.generate_summary(content)
-
-                    results.append({
-                        "id": story.id,
-                        "title": story.title,
-                        "url": story.url or "",
-                        "score": story.score,
-                        "summary": summary_lines,
-                    })
+                story = basic_stories[i - 1]
+                if not story:
+                    self.logger.warning(f"Failed to fetch story {story_id}")
+                    failed_articles += 1
+                    continue
+
+                content = basic_contents[i - 1]
+                summary_lines = self.generate_summary(content)
+
+                results.append(self._build_result(story, summary_lines))
                 
                 successful_articles += 1
-                article_time = time.time() - article_start_time
-                self.logger.debug(f"Successfully processed story {story_id} in {article_time:.2f}s")
+                if debug:
+                    article_time = time.time() - article_start_time
+                    self.logger.debug(f"Successfully processed story {story_id} in {article_time:.2f}s")
                 
             except Exception as e:
                 failed_articles += 1
                 self.logger.error(f"Failed to process story {story_id}: {e}", exc_info=True)
                 continue
 
-            # Add delay to be respectful to servers
-            self.logger.debug(f"Waiting {RATE_LIMIT_DELAY}s before next request")
-            time.sleep(RATE_LIMIT_DELAY)
+        return results, successful_articles, failed_articles
+    
+    def _fetch_stories_and_contents(
+        self, story_ids: List[int]
+    ) -> Tuple[List[Optional[HNStory]], Dict[int, ArticleContent]]:
+        """
+        Fetch story details and their article contents concurrently.
+        
+        Returns:
+            Tuple of (stories in story_ids order, contents keyed by index into story_ids)
+        """
+        stories = self.get_stories_bulk(story_ids)
+        return stories, self._extract_contents_by_index(stories)
+    
+    def _extract_contents_by_index(self, stories: List[Optional[HNStory]]) -> Dict[int, ArticleContent]:
+        """Extract article contents for the stories that were fetched, keyed by their index."""
+        fetched = [(index, story) for index, story in enumerate(stories) if story]
+        contents = self.extract_articles_content([story for _, story in fetched])
+        return {index: content for (index, _), content in zip(fetched, contents)}
+    
+    def _summarize_enhanced(self, story_ids: List[int]) -> Tuple[List[Dict], int, int]:
+        """
+        Fetch stories with their comments, then generate their summaries in one concurrent batch.
+        
+        Returns:
+            Tuple of (results, successful count, failed count)
+        """
+        failed_articles = 0
+        pending = []
 
-        self.logger.info(f"Summarization complete: {successful_articles} successful, {failed_articles} failed")
-        return results
+        # Story items (and their comment IDs) are fetched together up front
+        stories = self.get_stories_bulk(story_ids)
+
+        # Article pages download in the background while comments are fetched below
+        with ThreadPoolExecutor(max_workers=1) as prefetcher:
+            contents_future = prefetcher.submit(self._extract_contents_by_index, stories)
+
+            fetched = []
+            for i, (story_id, story) in enumerate(zip(story_ids, stories), 1):
+                self.logger.info(f"Processing story {i}/{len(story_ids)}: {story_id}")
+
+                if not story:
+                    self.logger.warning(f"Failed to fetch story {story_id}")
+                    failed_articles += 1
+                    continue
+                fetched.append((story, i - 1))
+
+            # Comments for every story are fetched together in one concurrent pass
+            self.logger.debug(f"Fetching comments for {len(fetched)} stories for enhanced mode")
+            try:
+                comment_lists = self.api_client.get_top_comments_bulk(
+                    [story for story, _ in fetched], MAX_COMMENTS_TO_FETCH
+                )
+                pending = [(story, index, comments) for (story, index), comments in zip(fetched, comment_lists)]
+            except Exception as e:
+                failed_articles += len(fetched)
+                self.logger.error(f"Failed to fetch comments: {e}", exc_info=True)
+
+            story_contents = contents_future.result()
+
+        pending = [(story, story_contents[index], comments) for story, index, comments in pending]
+
+        # LLM calls are the slow part, so they run concurrently once all inputs are ready
+        enhanced = hasattr(self.summarizer, 'enhanced_summarize_batch')
+        self.logger.debug(f"Generating {len(pending)} summaries with {self.summarizer.__class__.__name__}")
+        if enhanced:
+            outcomes = self.summarizer.enhanced_summarize_batch(
+                [(content, comments, story.id) for story, content, comments in pending]
+            )
+        else:
+            outcomes = self.summarizer.summarize_batch([content for _, content, _ in pending])
+
+        results: List[Dict] = []
+        for (story, _, _), outcome in zip(pending, outcomes):
+            if isinstance(outcome, Exception):
+                failed_articles += 1
+                self.logger.error(f"Failed to process story {story.id}: {outcome}", exc_info=outcome)
+                continue
+
+            if enhanced:
+                results.append(self._build_result(story, self._format_enhanced_summary_for_output(outcome), outcome))
+            else:
+                results.append(self._build_result(story, outcome))
+
+        return results, len(results), failed_articles
+    
+    @staticmethod
+    def _build_result(story: HNStory, summary_lines: List[str],
+                      enhanced: Optional[EnhancedSummary] = None) -> Dict:
+        """Build the result record both modes return for a summarized story."""
+        return {
+            "id": story.id,
+            "title": story.title,
+            "url": story.url or "",
+            "score": story.score,
+            "summary": summary_lines,
+            "enhanced": enhanced,
+        }
     
     def _format_enhanced_summary_for_output(self, enhanced_summary: EnhancedSummary) -> List[str]:
         """Format enhanced summary for CLI output compatibility."""
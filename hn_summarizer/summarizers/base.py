@@ -2,8 +2,10 @@
 Base class for article summarizers.
 """
 
+import logging
 from abc import ABC, abstractmethod
-from typing import List
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, List, Sequence, Union
 
 from ..models import ArticleContent, SummarizerConfig
 from ..config import SUMMARY_LINES
@@ -13,6 +15,9 @@ from ..logging_config import get_logger
 class BaseSummarizer(ABC):
     """Abstract base class for article summarizers."""
     
+    # Summaries generated concurrently by the batch methods; remote LLM summarizers raise this
+    max_workers = 1
+    
     def __init__(self, config: SummarizerConfig):
         self.config = config
         self.logger = get_logger(self.__class__.__name__)
@@ -30,6 +35,32 @@ class BaseSummarizer(ABC):
         """
         pass
     
+    def summarize_batch(self, contents: List[ArticleContent]) -> List[Union[List[str], Exception]]:
+        """
+        Summarize several articles, up to max_workers at a time.
+        
+        Args:
+            contents: The article contents to summarize
+            
+        Returns:
+            Summary lines for each article in input order, or the exception it raised
+        """
+        return self._run_batch(self.summarize, [(content,) for content in contents])
+    
+    def _run_batch(self, func: Callable, args_list: Sequence[tuple]) -> list:
+        """Call func with each argument tuple, returning results (or raised exceptions) in order."""
+        def call(args):
+            try:
+                return func(*args)
+            except Exception as e:
+                return e
+        
+        if self.max_workers <= 1 or len(args_list) <= 1:
+            return [call(args) for args in args_list]
+        
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(args_list))) as executor:
+            return list(executor.map(call, args_list))
+    
     def _ensure_line_count(self, lines: List[str], content: ArticleContent) -> List[str]:
         """
         Ensure we have exactly the required number of summary lines.
@@ -41,13 +72,18 @@ class BaseSummarizer(ABC):
         Returns:
             List with exactly SUMMARY_LINES lines
         """
+        # LLM output is usually already clean, so skip the rebuild when nothing would change
+        if len(lines) == SUMMARY_LINES and all(line and line == line.strip() for line in lines):
+            return lines
+
         # Remove empty lines
         lines = [line.strip() for line in lines if line.strip()]
         original_count = len(lines)
         
         # Truncate if too many lines
         if len(lines) > SUMMARY_LINES:
-            self.logger.debug(f"Truncating summary from {len(lines)} to {SUMMARY_LINES} lines")
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug(f"Truncating summary from {len(lines)} to {SUMMARY_LINES} lines")
             return lines[:SUMMARY_LINES]
         
         # Pad if too few lines
@@ -93,5 +129,6 @@ class BaseSummarizer(ABC):
             f"URL: {url_display}" if url_display else "No URL available"
         ]
         
-        self.logger.debug(f"Generated no-content fallback: {fallback_lines}")
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug(f"Generated no-content fallback: {fallback_lines}")
         return fallback_lines
\ No newline at end of file
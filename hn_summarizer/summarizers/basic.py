@@ -2,13 +2,22 @@
 Basic text processing summarizer.
 """
 
+import logging
 import re
-from typing import List
+from functools import lru_cache
+from itertools import islice
+from typing import List, Optional
 
 from .base import BaseSummarizer
-from ..models import ArticleContent
+from ..models import ArticleContent, SummarizerConfig, SummarizerMode
 from ..config import MIN_SENTENCE_LENGTH, MAX_LINE_LENGTH
 
+# Runs of text between sentence terminators, matching re.split(r'[.!?]+', ...) pieces
+_SENTENCE_RE = re.compile(r'[^.!?]+')
+
+# The summary only ever shows the first two qualifying sentences
+SUMMARY_SENTENCES = 2
+
 
 class BasicSummarizer(BaseSummarizer):
     """Basic summarizer using simple text processing."""
@@ -20,53 +29,48 @@ class BasicSummarizer(BaseSummarizer):
             return self._format_no_content_summary(content)
         
         # Extract sentences
-        sentences = self._extract_sentences(content.content)
-        self.logger.debug(f"Extracted {len(sentences)} sentences from {len(content.content)} chars of content")
+        sentences = self._extract_sentences(content.content, limit=SUMMARY_SENTENCES)
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug(f"Extracted {len(sentences)} sentences from {len(content.content)} chars of content")
         
         # Create summary lines
         summary_lines = self._create_summary_lines(content.title, sentences, content.url)
         
         return self._ensure_line_count(summary_lines, content)
     
-    def _extract_sentences(self, content: str) -> List[str]:
-        """Extract and filter sentences from content."""
-        sentences = re.split(r'[.!?]+', content)
-        sentences = [
-            s.strip() for s in sentences 
-            if len(s.strip()) > MIN_SENTENCE_LENGTH
-        ]
-        return sentences
+    def _extract_sentences(self, content: str, limit: Optional[int] = None) -> List[str]:
+        """Extract and filter sentences from content, stopping after limit sentences."""
+        stripped = (match.group().strip() for match in _SENTENCE_RE.finditer(content))
+        sentences = (s for s in stripped if len(s) > MIN_SENTENCE_LENGTH)
+        return list(islice(sentences, limit))
     
     def _create_summary_lines(self, title: str, sentences: List[str], url: str) -> List[str]:
         """Create summary lines from title and sentences."""
         summary_lines = [f"Article: {title}"]
         defaults_used = []
         
-        # First content line
-        if sentences:
-            first_sentence = sentences[0]
-            if len(first_sentence) > MAX_LINE_LENGTH:
-                first_sentence = first_sentence[:MAX_LINE_LENGTH] + "..."
-                self.logger.debug(f"Truncated first sentence to {MAX_LINE_LENGTH} chars")
-            summary_lines.append(first_sentence)
-        else:
-            default_line = "No content available."
-            summary_lines.append(default_line)
-            defaults_used.append(f"first content line: '{default_line}'")
-        
-        # Second content line
-        if len(sentences) > 1:
-            second_sentence = sentences[1]
-            if len(second_sentence) > MAX_LINE_LENGTH:
-                second_sentence = second_sentence[:MAX_LINE_LENGTH] + "..."
-                self.logger.debug(f"Truncated second sentence to {MAX_LINE_LENGTH} chars")
-            summary_lines.append(second_sentence)
-        else:
-            default_line = f"URL: {url}"
-            summary_lines.append(default_line)
-            defaults_used.append(f"second content line: '{default_line}'")
+        # One line per leading sentence, with a placeholder standing in for each missing one
+        defaults = (("first", "No content available."), ("second", f"URL: {url}"))
+        for position, (label, default_line) in enumerate(defaults):
+            if position < len(sentences):
+                sentence = sentences[position]
+                if len(sentence) > MAX_LINE_LENGTH:
+                    sentence = sentence[:MAX_LINE_LENGTH] + "..."
+                    if self.logger.isEnabledFor(logging.DEBUG):
+                        self.logger.debug(f"Truncated {label} sentence to {MAX_LINE_LENGTH} chars")
+                summary_lines.append(sentence)
+            else:
+                summary_lines.append(default_line)
+                defaults_used.append(f"{label} content line: '{default_line}'")
         
         if defaults_used:
             self.logger.warning(f"BasicSummarizer using defaults for: {'; '.join(defaults_used)}")
         
-        return summary_lines
\ No newline at end of file
+        return summary_lines
+
+
+@lru_cache(maxsize=None)
+def get_fallback_summarizer() -> BasicSummarizer:
+    """Return the BasicSummarizer the LLM summarizers fall back to, created on first use and shared."""
+    # BasicSummarizer keeps no per-run state, so one instance serves every caller
+    return BasicSummarizer(SummarizerConfig(mode=SummarizerMode.BASIC))
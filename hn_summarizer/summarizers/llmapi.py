@@ -3,11 +3,15 @@ LLM API-based summarizer using external APIs (OpenAI).
 """
 
 import os
+import orjson
 import requests
-from typing import List
+from itertools import islice
+from typing import List, Optional, Tuple, Union
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from .base import BaseSummarizer
-from .basic import BasicSummarizer
+from .basic import BasicSummarizer, get_fallback_summarizer
 from ..models import ArticleContent, SummarizerConfig, HNComment, EnhancedSummary
 from ..config import (
     OPENAI_API_URL,
@@ -16,16 +20,39 @@ from ..config import (
     OPENAI_ENHANCED_MAX_TOKENS,
     OPENAI_TEMPERATURE,
     OPENAI_TIMEOUT,
-    MAX_COMMENTS_FOR_SUMMARY,
+    OPENAI_CONNECT_TIMEOUT,
+    OPENAI_RATE_LIMIT,
+    MAX_LLM_WORKERS,
+    LLM_CIRCUIT_FAILURES,
+    LLM_CIRCUIT_RESET,
+    SUMMARY_LINES,
+    HTTP_RETRIES,
+    HTTP_RETRY_BACKOFF,
+    HTTP_RETRY_JITTER,
+    HTTP_RETRY_STATUSES,
     KEY_POINTS_COUNT,
     RELATED_LINKS_COUNT,
 )
+from .prompts import (
+    SUMMARY_SYSTEM_PROMPT,
+    ENHANCED_SYSTEM_PROMPT,
+    create_summary_prompt,
+    create_enhanced_prompt,
+    create_comments_section,
+    parse_sections,
+    NUMBERED_ITEM_RE,
+)
+from ..circuit import CircuitBreaker
+from ..llm_cache import LLMCache
+from ..ratelimit import HostRateLimiter
 from ..logging_config import get_logger, log_performance
 
 
 class LLMAPISummarizer(BaseSummarizer):
     """Summarizer using external LLM APIs (OpenAI)."""
     
+    max_workers = MAX_LLM_WORKERS
+    
     def __init__(self, config: SummarizerConfig):
         super().__init__(config)
         self.api_url = OPENAI_API_URL
@@ -33,10 +60,26 @@ class LLMAPISummarizer(BaseSummarizer):
         self.max_tokens = config.max_tokens or OPENAI_MAX_TOKENS
         self.temperature = config.temperature or OPENAI_TEMPERATURE
         self.timeout = config.timeout or OPENAI_TIMEOUT
-        self.fallback = BasicSummarizer(config)
+        # Connecting gets a short timeout of its own; only generation needs the full read timeout
+        self.request_timeout = (OPENAI_CONNECT_TIMEOUT, self.timeout)
+        # Read once so every call in a run uses the same key
+        self.api_key = os.getenv("OPENAI_API_KEY")
+        self.session = self._build_session()
+        # Paces batch workers below the API's request limit instead of relying on 429 retries
+        self.rate_limiter = HostRateLimiter(OPENAI_RATE_LIMIT)
+        # During an outage, articles fall back immediately instead of each waiting out retries and timeouts
+        self.breaker = CircuitBreaker(
+            "LLM API", LLM_CIRCUIT_FAILURES, LLM_CIRCUIT_RESET, (requests.RequestException,)
+        )
+        self.cache = LLMCache() if config.use_cache else None
         self.logger = get_logger(self.__class__.__name__)
         self.logger.info(f"Initialized LLMAPISummarizer with model: {self.model}, max_tokens: {self.max_tokens}")
     
+    @property
+    def fallback(self) -> BasicSummarizer:
+        """Basic summarizer used when the LLM is unavailable; only built if a fallback happens."""
+        return get_fallback_summarizer()
+    
     def summarize(self, content: ArticleContent) -> List[str]:
         """Generate summary using LLM API with optional fallback to basic."""
         if not content.content:
@@ -46,8 +89,7 @@ class LLMAPISummarizer(BaseSummarizer):
             return self._generate_api_summary(content)
         except Exception as e:
             if self.config.allow_fallback:
-                print(f"LLM API summarization failed: {e}")
-                print("Falling back to basic summarization...")
+                self.logger.warning(f"LLM API summarization failed, falling back to basic summarization: {e}")
                 return self.fallback.summarize(content)
             else:
                 raise RuntimeError(f"LLM API summarization failed: {e}. Use --fallback to enable basic mode fallback.") from e
@@ -58,46 +100,116 @@ class LLMAPISummarizer(BaseSummarizer):
             return self._generate_enhanced_api_summary(content, comments, story_id)
         except Exception as e:
             if self.config.allow_fallback:
-                print(f"Enhanced LLM API summarization failed: {e}")
-                print("Falling back to basic enhanced summary...")
+                self.logger.warning(f"Enhanced LLM API summarization failed, falling back to basic enhanced summary: {e}")
                 return self._generate_basic_enhanced_summary(content, comments, story_id)
             else:
                 raise RuntimeError(f"Enhanced LLM API summarization failed: {e}. Use --fallback to enable basic mode fallback.") from e
     
-    def _generate_api_summary(self, content: ArticleContent) -> List[str]:
-        """Generate summary using OpenAI API."""
-        api_key = os.getenv("OPENAI_API_KEY")
-        if not api_key:
-            if self.config.allow_fallback:
-                print("OPENAI_API_KEY not found, falling back to basic mode")
-                return self.fallback.summarize(content)
-            else:
-                raise RuntimeError("OPENAI_API_KEY environment variable not set. Use --fallback to enable basic mode fallback.")
-        
-        headers = {
-            "Authorization": f"Bearer {api_key}",
-            "Content-Type": "application/json"
-        }
-        
-        prompt = self._create_prompt(content.title, content.content)
+    def enhanced_summarize_batch(
+        self, items: List[Tuple[ArticleContent, List[HNComment], int]]
+    ) -> List[Union[EnhancedSummary, Exception]]:
+        """Run enhanced_summarize for several (content, comments, story_id) items concurrently."""
+        return self._run_batch(self.enhanced_summarize, items)
+    
+    def _build_session(self) -> requests.Session:
+        """Create the session shared by all API calls, so batch workers reuse pooled TLS connections."""
+        session = requests.Session()
+        # Payloads are serialized with orjson and sent as raw bytes
+        session.headers["Content-Type"] = "application/json"
+        if self.api_key:
+            session.headers["Authorization"] = f"Bearer {self.api_key}"
+        # Rate limits and transient 5xx are retried with backoff (honouring Retry-After).
+        # Completions have no side effects, so POSTs are safe to retry.
+        retries = Retry(
+            total=HTTP_RETRIES,
+            backoff_factor=HTTP_RETRY_BACKOFF,
+            backoff_jitter=HTTP_RETRY_JITTER,
+            status_forcelist=HTTP_RETRY_STATUSES,
+            allowed_methods=None,
+            raise_on_status=False,
+        )
+        adapter = HTTPAdapter(pool_maxsize=MAX_LLM_WORKERS, max_retries=retries)
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        return session
+    
+    def _generate(self, system: str, prompt: str, max_tokens: int, max_lines: Optional[int] = None) -> str:
+        """
+        Send a prompt to the chat completions API and return the reply, consulting the LLM cache first.
+        
+        Args:
+            max_lines: Stream the reply and stop once this many non-empty lines have arrived
+        """
+        cache_key = f"{system}\n\n{prompt}"
+        if self.cache:
+            cached = self.cache.get(self.model, cache_key)
+            if cached is not None:
+                return cached
         
         payload = {
             "model": self.model,
-            "messages": [{"role": "user", "content": prompt}],
-            "max_tokens": self.max_tokens,
+            # The system message comes first and never changes, so it is served from the prompt cache
+            "messages": [
+                {"role": "system", "content": system},
+                {"role": "user", "content": prompt},
+            ],
+            "max_tokens": max_tokens,
             "temperature": self.temperature
         }
         
-        response = requests.post(
-            self.api_url,
-            headers=headers,
-            json=payload,
-            timeout=self.timeout
+        with self.breaker:
+            self.rate_limiter.wait(self.api_url)
+            if max_lines:
+                response_text = self._stream_reply(payload, max_lines)
+            else:
+                response = self.session.post(self.api_url, data=orjson.dumps(payload), timeout=self.request_timeout)
+                response.raise_for_status()
+                
+                result = orjson.loads(response.content)
+                response_text = result["choices"][0]["message"]["content"].strip()
+        
+        if self.cache and response_text:
+            self.cache.set(self.model, cache_key, response_text)
+        return response_text
+    
+    def _stream_reply(self, payload: dict, max_lines: int) -> str:
+        """Stream a completion, closing the connection once max_lines non-empty lines are complete."""
+        response = self.session.post(
+            self.api_url, data=orjson.dumps({**payload, "stream": True}), timeout=self.request_timeout, stream=True
         )
-        response.raise_for_status()
+        try:
+            response.raise_for_status()
+            reply = ""
+            # Server-sent events: one "data: {json}" line per chunk, ending with "data: [DONE]"
+            for line in response.iter_lines():
+                if not line.startswith(b"data: "):
+                    continue
+                data = line[len(b"data: "):]
+                if data == b"[DONE]":
+                    break
+                choices = orjson.loads(data).get("choices")
+                if choices:
+                    reply += choices[0].get("delta", {}).get("content") or ""
+                # The text after the last newline may still be arriving, so only count finished lines
+                finished = reply.rpartition("\n")[0]
+                if sum(1 for text in finished.split("\n") if text.strip()) >= max_lines:
+                    break
+        finally:
+            # Closing early stops generation, so unneeded tokens are neither waited for nor billed
+            response.close()
+        return reply.strip()
+    
+    def _generate_api_summary(self, content: ArticleContent) -> List[str]:
+        """Generate summary using OpenAI API."""
+        if not self.api_key:
+            if self.config.allow_fallback:
+                self.logger.warning("OPENAI_API_KEY not found, falling back to basic mode")
+                return self.fallback.summarize(content)
+            else:
+                raise RuntimeError("OPENAI_API_KEY environment variable not set. Use --fallback to enable basic mode fallback.")
         
-        result = response.json()
-        summary_text = result["choices"][0]["message"]["content"].strip()
+        prompt = create_summary_prompt(content.title, content.content)
+        summary_text = self._generate(SUMMARY_SYSTEM_PROMPT, prompt, self.max_tokens, max_lines=SUMMARY_LINES)
         
         if summary_text:
             lines = self._parse_summary_response(summary_text)
@@ -109,19 +221,11 @@ class LLMAPISummarizer(BaseSummarizer):
         else:
             raise RuntimeError("LLM API returned empty response. Use --fallback to enable basic mode fallback.")
     
-    def _create_prompt(self, title: str, content: str) -> str:
-        """Create prompt for API summarization."""
-        return f"""Summarize the following article in exactly 3 lines:
-
-Title: {title}
-Content: {content[:2000]}
-
-Please provide exactly 3 concise lines that capture the key points."""
-    
     def _parse_summary_response(self, response_text: str) -> List[str]:
         """Parse and clean the summary response from API."""
-        lines = response_text.split('\n')
-        lines = [line.strip() for line in lines if line.strip()]
+        # Only the first three non-empty lines are used, so stop reading there
+        stripped = (line.strip() for line in response_text.splitlines())
+        lines = list(islice((line for line in stripped if line), 3))
         
         # Ensure we have valid lines
         if len(lines) >= 3:
@@ -146,49 +250,18 @@ Please provide exactly 3 concise lines that capture the key points."""
     
     def _generate_enhanced_api_summary(self, content: ArticleContent, comments: List[HNComment], story_id: int) -> EnhancedSummary:
         """Generate enhanced summary using OpenAI API."""
-        api_key = os.getenv("OPENAI_API_KEY")
-        if not api_key:
+        if not self.api_key:
             if self.config.allow_fallback:
-                print("OPENAI_API_KEY not found, falling back to basic mode")
+                self.logger.warning("OPENAI_API_KEY not found, falling back to basic mode")
                 return self._generate_basic_enhanced_summary(content, comments, story_id)
             else:
                 raise RuntimeError("OPENAI_API_KEY environment variable not set. Use --fallback to enable basic mode fallback.")
         
-        headers = {
-            "Authorization": f"Bearer {api_key}",
-            "Content-Type": "application/json"
-        }
-        
         # Prepare comment text
-        comment_texts = []
-        for comment in comments[:MAX_COMMENTS_FOR_SUMMARY]:
-            if comment.text.strip():
-                # Remove HTML tags from comment text
-                import re
-                clean_text = re.sub(r'<[^>]+>', '', comment.text)
-                comment_texts.append(f"Comment by {comment.by or 'Anonymous'}: {clean_text[:500]}")
-        
-        comments_section = "\n\n".join(comment_texts) if comment_texts else "No significant comments available."
-        
-        prompt = self._create_enhanced_prompt(content.title, content.content, comments_section)
-        
-        payload = {
-            "model": self.model,
-            "messages": [{"role": "user", "content": prompt}],
-            "max_tokens": OPENAI_ENHANCED_MAX_TOKENS,
-            "temperature": self.temperature
-        }
-        
-        response = requests.post(
-            self.api_url,
-            headers=headers,
-            json=payload,
-            timeout=self.timeout
-        )
-        response.raise_for_status()
+        comments_section = create_comments_section(comments)
         
-        result = response.json()
-        summary_text = result["choices"][0]["message"]["content"].strip()
+        prompt = create_enhanced_prompt(content.title, content.content, comments_section)
+        summary_text = self._generate(ENHANCED_SYSTEM_PROMPT, prompt, OPENAI_ENHANCED_MAX_TOKENS)
         
         if summary_text:
             return self._parse_enhanced_summary_response(summary_text, content, story_id)
@@ -199,41 +272,8 @@ Please provide exactly 3 concise lines that capture the key points."""
         else:
             raise RuntimeError("LLM API returned empty enhanced response. Use --fallback to enable basic mode fallback.")
     
-    def _create_enhanced_prompt(self, title: str, content: str, comments: str) -> str:
-        """Create enhanced prompt for comprehensive summarization."""
-        return f"""Analyze this Hacker News article and discussion comprehensively:
-
-ARTICLE:
-Title: {title}
-Content: {content[:3000]}
-
-DISCUSSION COMMENTS:
-{comments}
-
-Please provide a structured analysis in the following format:
-
-ARTICLE_SUMMARY:
-[2-3 sentences summarizing the main article content and key insights]
-
-COMMENT_SUMMARY:
-[2-3 sentences summarizing the key points and perspectives from the discussion]
-
-KEY_POINTS:
-1. [First key takeaway from article and discussion]
-2. [Second key takeaway from article and discussion]
-3. [Third key takeaway from article and discussion]
-
-RELATED_LINKS:
-1. [Suggest a relevant search term or topic to explore this subject deeper]
-2. [Suggest another relevant search term or related technology/concept]
-3. [Suggest a third area for deeper exploration related to this topic]
-
-Provide concrete, specific insights rather than generic summaries."""
-    
     def _parse_enhanced_summary_response(self, response_text: str, content: ArticleContent, story_id: int) -> EnhancedSummary:
         """Parse the enhanced summary response from API."""
-        import re
-        
         self.logger.debug(f"Parsing enhanced summary response from LLM API ({len(response_text)} chars)")
         
         # Initialize default values
@@ -245,29 +285,31 @@ Provide concrete, specific insights rather than generic summaries."""
         # Track what we're using defaults for
         using_defaults = []
         
+        sections = parse_sections(response_text)
+        
         # Parse article summary
-        article_match = re.search(r'ARTICLE_SUMMARY:\s*\n(.*?)(?=\n[A-Z_]+:|$)', response_text, re.DOTALL)
-        if article_match:
-            article_summary = article_match.group(1).strip()
+        article_text = sections.get("ARTICLE_SUMMARY")
+        if article_text is not None:
+            article_summary = article_text.strip()
             self.logger.debug("Successfully parsed article summary from LLM API response")
         else:
             using_defaults.append("article_summary")
             self.logger.warning("Failed to parse ARTICLE_SUMMARY from LLM API response, using default")
         
         # Parse comment summary
-        comment_match = re.search(r'COMMENT_SUMMARY:\s*\n(.*?)(?=\n[A-Z_]+:|$)', response_text, re.DOTALL)
-        if comment_match:
-            comment_summary = comment_match.group(1).strip()
+        comment_text = sections.get("COMMENT_SUMMARY")
+        if comment_text is not None:
+            comment_summary = comment_text.strip()
             self.logger.debug("Successfully parsed comment summary from LLM API response")
         else:
             using_defaults.append("comment_summary")
             self.logger.warning("Failed to parse COMMENT_SUMMARY from LLM API response, using default")
         
         # Parse key points
-        key_points_match = re.search(r'KEY_POINTS:\s*\n(.*?)(?=\n[A-Z_]+:|$)', response_text, re.DOTALL)
-        if key_points_match:
-            points_text = key_points_match.group(1).strip()
-            points = re.findall(r'\d+\.\s*(.*?)(?=\n\d+\.|\n[A-Z_]+:|$)', points_text, re.DOTALL)
+        points_text = sections.get("KEY_POINTS")
+        if points_text is not None:
+            points_text = points_text.strip()
+            points = NUMBERED_ITEM_RE.findall(points_text)
             if points:
                 key_points = [point.strip() for point in points[:KEY_POINTS_COUNT]]
                 self.logger.debug(f"Successfully parsed {len(points)} key points from LLM API response")
@@ -285,10 +327,10 @@ Provide concrete, specific insights rather than generic summaries."""
             self.logger.warning("Failed to parse KEY_POINTS from LLM API response, using defaults")
         
         # Parse related links
-        links_match = re.search(r'RELATED_LINKS:\s*\n(.*?)(?=\n[A-Z_]+:|$)', response_text, re.DOTALL)
-        if links_match:
-            links_text = links_match.group(1).strip()
-            links = re.findall(r'\d+\.\s*(.*?)(?=\n\d+\.|\n[A-Z_]+:|$)', links_text, re.DOTALL)
+        links_text = sections.get("RELATED_LINKS")
+        if links_text is not None:
+            links_text = links_text.strip()
+            links = NUMBERED_ITEM_RE.findall(links_text)
             if links:
                 related_links = [link.strip() for link in links[:RELATED_LINKS_COUNT]]
                 self.logger.debug(f"Successfully parsed {len(links)} related links from LLM API response")
@@ -364,5 +406,6 @@ Provide concrete, specific insights rather than generic summaries."""
             key_points=key_points,
             related_links=related_links,
             original_url=content.url,
-            hn_discussion_url=f"https://news.ycombinator.com/item?id={story_id}"
+            hn_discussion_url=f"https://news.ycombinator.com/item?id={story_id}",
+            fallback_used=True
         )
\ No newline at end of file
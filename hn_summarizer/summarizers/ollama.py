@@ -2,37 +2,75 @@
 Ollama-based summarizer using local LLM.
 """
 
+import orjson
 import requests
-from typing import List
+from itertools import islice
+from typing import List, Tuple, Union
+from requests.adapters import HTTPAdapter
 
 from .base import BaseSummarizer
-from .basic import BasicSummarizer
+from .basic import BasicSummarizer, get_fallback_summarizer
 from ..models import ArticleContent, SummarizerConfig, HNComment, EnhancedSummary
 from ..config import (
     OLLAMA_BASE_URL,
     OLLAMA_GENERATE_ENDPOINT,
     OLLAMA_DEFAULT_MODEL,
     OLLAMA_TIMEOUT,
-    MAX_COMMENTS_FOR_SUMMARY,
+    OLLAMA_CONNECT_TIMEOUT,
+    MAX_LLM_WORKERS,
+    LLM_CIRCUIT_FAILURES,
+    LLM_CIRCUIT_RESET,
     ENHANCED_SUMMARY_TOKENS,
     KEY_POINTS_COUNT,
     RELATED_LINKS_COUNT,
 )
+from .prompts import (
+    SUMMARY_SYSTEM_PROMPT,
+    ENHANCED_SYSTEM_PROMPT,
+    create_summary_prompt,
+    create_enhanced_prompt,
+    create_comments_section,
+    parse_sections,
+    NUMBERED_ITEM_RE,
+)
+from ..circuit import CircuitBreaker
+from ..llm_cache import LLMCache
 from ..logging_config import get_logger, log_performance
 
 
 class OllamaSummarizer(BaseSummarizer):
     """Summarizer using Ollama local LLM."""
     
+    max_workers = MAX_LLM_WORKERS
+    
     def __init__(self, config: SummarizerConfig):
         super().__init__(config)
         self.base_url = OLLAMA_BASE_URL
+        self.generate_url = f"{self.base_url}{OLLAMA_GENERATE_ENDPOINT}"
         self.model = config.ollama_model or config.model_name or OLLAMA_DEFAULT_MODEL
         self.timeout = config.timeout or OLLAMA_TIMEOUT
-        self.fallback = BasicSummarizer(config)
+        self.request_timeout = (OLLAMA_CONNECT_TIMEOUT, self.timeout)
+        # Reused across calls so batch workers keep their connections to Ollama alive
+        self.session = requests.Session()
+        # Payloads are serialized with orjson and sent as raw bytes
+        self.session.headers["Content-Type"] = "application/json"
+        # One pooled connection per batch worker, so none is discarded after a concurrent call
+        adapter = HTTPAdapter(pool_maxsize=MAX_LLM_WORKERS)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        # If Ollama is not running, later articles fall back without each attempting a connection
+        self.breaker = CircuitBreaker(
+            "Ollama", LLM_CIRCUIT_FAILURES, LLM_CIRCUIT_RESET, (requests.RequestException,)
+        )
+        self.cache = LLMCache() if config.use_cache else None
         self.logger = get_logger(self.__class__.__name__)
         self.logger.info(f"Initialized OllamaSummarizer with model: {self.model}, timeout: {self.timeout}s")
     
+    @property
+    def fallback(self) -> BasicSummarizer:
+        """Basic summarizer used when the LLM is unavailable; only built if a fallback happens."""
+        return get_fallback_summarizer()
+    
     def summarize(self, content: ArticleContent) -> List[str]:
         """Generate summary using Ollama LLM with optional fallback to basic."""
         if not content.content:
@@ -42,8 +80,7 @@ class OllamaSummarizer(BaseSummarizer):
             return self._generate_ollama_summary(content)
         except Exception as e:
             if self.config.allow_fallback:
-                print(f"Ollama summarization failed: {e}")
-                print("Falling back to basic summarization...")
+                self.logger.warning(f"Ollama summarization failed, falling back to basic summarization: {e}")
                 return self.fallback.summarize(content)
             else:
                 raise RuntimeError(f"Ollama summarization failed: {e}. Use --fallback to enable basic mode fallback.") from e
@@ -54,36 +91,57 @@ class OllamaSummarizer(BaseSummarizer):
             return self._generate_enhanced_ollama_summary(content, comments, story_id)
         except Exception as e:
             if self.config.allow_fallback:
-                print(f"Enhanced Ollama summarization failed: {e}")
-                print("Falling back to basic enhanced summary...")
+                self.logger.warning(f"Enhanced Ollama summarization failed, falling back to basic enhanced summary: {e}")
                 return self._generate_basic_enhanced_summary(content, comments, story_id)
             else:
                 raise RuntimeError(f"Enhanced Ollama summarization failed: {e}. Use --fallback to enable basic mode fallback.") from e
     
-    @log_performance(get_logger("OllamaSummarizer._generate_ollama_summary"), "Ollama API call")
-    def _generate_ollama_summary(self, content: ArticleContent) -> List[str]:
-        """Generate summary using Ollama API."""
-        url = f"{self.base_url}{OLLAMA_GENERATE_ENDPOINT}"
-        
-        prompt = self._create_prompt(content.title, content.content)
-        self.logger.debug(f"Sending prompt to Ollama (length: {len(prompt)} chars)")
-        
+    def enhanced_summarize_batch(
+        self, items: List[Tuple[ArticleContent, List[HNComment], int]]
+    ) -> List[Union[EnhancedSummary, Exception]]:
+        """Run enhanced_summarize for several (content, comments, story_id) items concurrently."""
+        return self._run_batch(self.enhanced_summarize, items)
+    
+    def _generate(self, system: str, prompt: str, num_predict: int) -> str:
+        """Send a prompt to Ollama and return the response text, consulting the LLM cache first."""
+        cache_key = f"{system}\n\n{prompt}"
+        if self.cache:
+            cached = self.cache.get(self.model, cache_key)
+            if cached is not None:
+                return cached
+        
+        url = self.generate_url
         payload = {
             "model": self.model,
+            # A fixed system prompt lets Ollama reuse its KV cache for the shared prefix
+            "system": system,
             "prompt": prompt,
             "stream": False,
             "options": {
                 "temperature": self.config.temperature or 0.7,
-                "num_predict": self.config.max_tokens or 200
+                "num_predict": num_predict
             }
         }
         
         self.logger.debug(f"Making request to Ollama API: {url}")
-        response = requests.post(url, json=payload, timeout=self.timeout)
-        response.raise_for_status()
+        with self.breaker:
+            response = self.session.post(url, data=orjson.dumps(payload), timeout=self.request_timeout)
+            response.raise_for_status()
         
-        result = response.json()
-        summary_text = result.get("response", "").strip()
+        result = orjson.loads(response.content)
+        response_text = result.get("response", "").strip()
+        
+        if self.cache and response_text:
+            self.cache.set(self.model, cache_key, response_text)
+        return response_text
+    
+    @log_performance(get_logger("OllamaSummarizer._generate_ollama_summary"), "Ollama API call")
+    def _generate_ollama_summary(self, content: ArticleContent) -> List[str]:
+        """Generate summary using Ollama API."""
+        prompt = create_summary_prompt(content.title, content.content)
+        self.logger.debug(f"Sending prompt to Ollama (length: {len(prompt)} chars)")
+        
+        summary_text = self._generate(SUMMARY_SYSTEM_PROMPT, prompt, self.config.max_tokens or 200)
         
         self.logger.debug(f"Received response from Ollama (length: {len(summary_text)} chars)")
         self.logger.debug(f"Raw Ollama response: {summary_text[:1000]}{'...' if len(summary_text) > 1000 else ''}")
@@ -103,19 +161,11 @@ class OllamaSummarizer(BaseSummarizer):
             self.logger.debug(f"Empty Ollama response: '{summary_text}'")
             raise RuntimeError("Ollama returned empty response. Use --fallback to enable basic mode fallback.")
     
-    def _create_prompt(self, title: str, content: str) -> str:
-        """Create prompt for Ollama summarization."""
-        return f"""Summarize the following article in exactly 3 lines:
-
-Title: {title}
-Content: {content[:2000]}
-
-Provide a concise 3-line summary:"""
-    
     def _parse_summary_response(self, response_text: str) -> List[str]:
         """Parse and clean the summary response from Ollama."""
-        lines = response_text.split('\n')
-        lines = [line.strip() for line in lines if line.strip()]
+        # Only the first three non-empty lines are used, so stop reading there
+        stripped = (line.strip() for line in response_text.splitlines())
+        lines = list(islice((line for line in stripped if line), 3))
         
         # Ensure we have valid lines
         if len(lines) >= 3:
@@ -141,36 +191,11 @@ Provide a concise 3-line summary:"""
     
     def _generate_enhanced_ollama_summary(self, content: ArticleContent, comments: List[HNComment], story_id: int) -> EnhancedSummary:
         """Generate enhanced summary using Ollama API."""
-        url = f"{self.base_url}{OLLAMA_GENERATE_ENDPOINT}"
-        
         # Prepare comment text
-        comment_texts = []
-        for comment in comments[:MAX_COMMENTS_FOR_SUMMARY]:
-            if comment.text.strip():
-                # Remove HTML tags from comment text
-                import re
-                clean_text = re.sub(r'<[^>]+>', '', comment.text)
-                comment_texts.append(f"Comment by {comment.by or 'Anonymous'}: {clean_text[:500]}")
-        
-        comments_section = "\n\n".join(comment_texts) if comment_texts else "No significant comments available."
+        comments_section = create_comments_section(comments)
         
-        prompt = self._create_enhanced_prompt(content.title, content.content, comments_section)
-        
-        payload = {
-            "model": self.model,
-            "prompt": prompt,
-            "stream": False,
-            "options": {
-                "temperature": self.config.temperature or 0.7,
-                "num_predict": ENHANCED_SUMMARY_TOKENS
-            }
-        }
-        
-        response = requests.post(url, json=payload, timeout=self.timeout)
-        response.raise_for_status()
-        
-        result = response.json()
-        summary_text = result.get("response", "").strip()
+        prompt = create_enhanced_prompt(content.title, content.content, comments_section)
+        summary_text = self._generate(ENHANCED_SYSTEM_PROMPT, prompt, ENHANCED_SUMMARY_TOKENS)
         
         self.logger.debug(f"Received enhanced response from Ollama (length: {len(summary_text)} chars)")
         self.logger.debug(f"Raw Ollama enhanced response: {summary_text[:1000]}{'...' if len(summary_text) > 1000 else ''}")
@@ -188,41 +213,8 @@ Provide a concise 3-line summary:"""
             self.logger.debug(f"Empty Ollama enhanced response: '{summary_text}'")
             raise RuntimeError("Ollama returned empty enhanced response. Use --fallback to enable basic mode fallback.")
     
-    def _create_enhanced_prompt(self, title: str, content: str, comments: str) -> str:
-        """Create enhanced prompt for comprehensive summarization."""
-        return f"""Analyze this Hacker News article and discussion comprehensively:
-
-ARTICLE:
-Title: {title}
-Content: {content[:3000]}
-
-DISCUSSION COMMENTS:
-{comments}
-
-Please provide a structured analysis in the following format:
-
-ARTICLE_SUMMARY:
-[2-3 sentences summarizing the main article content and key insights]
-
-COMMENT_SUMMARY:
-[2-3 sentences summarizing the key points and perspectives from the discussion]
-
-KEY_POINTS:
-1. [First key takeaway from article and discussion]
-2. [Second key takeaway from article and discussion]  
-3. [Third key takeaway from article and discussion]
-
-RELATED_LINKS:
-1. [Suggest a relevant search term or topic to explore this subject deeper]
-2. [Suggest another relevant search term or related technology/concept]
-3. [Suggest a third area for deeper exploration related to this topic]
-
-Provide concrete, specific insights rather than generic summaries."""
-    
     def _parse_enhanced_summary_response(self, response_text: str, content: ArticleContent, story_id: int) -> EnhancedSummary:
         """Parse the enhanced summary response from Ollama."""
-        import re
-        
         self.logger.debug(f"Parsing enhanced summary response ({len(response_text)} chars)")
         
         # Initialize default values
@@ -234,29 +226,31 @@ Provide concrete, specific insights rather than generic summaries."""
         # Track what we're using defaults for
         using_defaults = []
         
+        sections = parse_sections(response_text)
+        
         # Parse article summary
-        article_match = re.search(r'ARTICLE_SUMMARY:\s*\n(.*?)(?=\n[A-Z_]+:|$)', response_text, re.DOTALL)
-        if article_match:
-            article_summary = article_match.group(1).strip()
+        article_text = sections.get("ARTICLE_SUMMARY")
+        if article_text is not None:
+            article_summary = article_text.strip()
             self.logger.debug("Successfully parsed article summary from Ollama response")
         else:
             using_defaults.append("article_summary")
             self.logger.warning("Failed to parse ARTICLE_SUMMARY from Ollama response, using default")
         
         # Parse comment summary
-        comment_match = re.search(r'COMMENT_SUMMARY:\s*\n(.*?)(?=\n[A-Z_]+:|$)', response_text, re.DOTALL)
-        if comment_match:
-            comment_summary = comment_match.group(1).strip()
+        comment_text = sections.get("COMMENT_SUMMARY")
+        if comment_text is not None:
+            comment_summary = comment_text.strip()
             self.logger.debug("Successfully parsed comment summary from Ollama response")
         else:
             using_defaults.append("comment_summary")
             self.logger.warning("Failed to parse COMMENT_SUMMARY from Ollama response, using default")
         
         # Parse key points
-        key_points_match = re.search(r'KEY_POINTS:\s*\n(.*?)(?=\n[A-Z_]+:|$)', response_text, re.DOTALL)
-        if key_points_match:
-            points_text = key_points_match.group(1).strip()
-            points = re.findall(r'\d+\.\s*(.*?)(?=\n\d+\.|\n[A-Z_]+:|$)', points_text, re.DOTALL)
+        points_text = sections.get("KEY_POINTS")
+        if points_text is not None:
+            points_text = points_text.strip()
+            points = NUMBERED_ITEM_RE.findall(points_text)
             if points:
                 key_points = [point.strip() for point in points[:KEY_POINTS_COUNT]]
                 self.logger.debug(f"Successfully parsed {len(points)} key points from Ollama response")
@@ -274,10 +268,10 @@ Provide concrete, specific insights rather than generic summaries."""
             self.logger.warning("Failed to parse KEY_POINTS from Ollama response, using defaults")
         
         # Parse related links
-        links_match = re.search(r'RELATED_LINKS:\s*\n(.*?)(?=\n[A-Z_]+:|$)', response_text, re.DOTALL)
-        if links_match:
-            links_text = links_match.group(1).strip()
-            links = re.findall(r'\d+\.\s*(.*?)(?=\n\d+\.|\n[A-Z_]+:|$)', links_text, re.DOTALL)
+        links_text = sections.get("RELATED_LINKS")
+        if links_text is not None:
+            links_text = links_text.strip()
+            links = NUMBERED_ITEM_RE.findall(links_text)
             if links:
                 related_links = [link.strip() for link in links[:RELATED_LINKS_COUNT]]
                 self.logger.debug(f"Successfully parsed {len(links)} related links from Ollama response")
@@ -353,5 +347,6 @@ Provide concrete, specific insights rather than generic summaries."""
             key_points=key_points,
             related_links=related_links,
             original_url=content.url,
-            hn_discussion_url=f"https://news.ycombinator.com/item?id={story_id}"
+            hn_discussion_url=f"https://news.ycombinator.com/item?id={story_id}",
+            fallback_used=True
         )
\ No newline at end of file
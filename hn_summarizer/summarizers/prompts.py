@@ -0,0 +1,87 @@
+"""
+Prompt text shared by the LLM-backed summarizers, and the patterns that parse their replies.
+
+The instructions are sent as a fixed system prompt, ahead of the per-article
+text, so that servers with prompt prefix caching (Ollama's KV cache, OpenAI's
+automatic prompt caching) can reuse them across articles.
+"""
+
+import re
+from typing import Dict, List
+
+from ..config import MAX_COMMENTS_FOR_SUMMARY
+from ..models import HNComment
+
+SUMMARY_SYSTEM_PROMPT = """You summarize articles posted to Hacker News.
+Reply with exactly 3 concise lines that capture the key points of the article, one per line, with no introduction or closing remarks."""
+
+ENHANCED_SYSTEM_PROMPT = """You analyze Hacker News articles and their discussions comprehensively.
+
+Provide a structured analysis in the following format:
+
+ARTICLE_SUMMARY:
+[2-3 sentences summarizing the main article content and key insights]
+
+COMMENT_SUMMARY:
+[2-3 sentences summarizing the key points and perspectives from the discussion]
+
+KEY_POINTS:
+1. [First key takeaway from article and discussion]
+2. [Second key takeaway from article and discussion]
+3. [Third key takeaway from article and discussion]
+
+RELATED_LINKS:
+1. [Suggest a relevant search term or topic to explore this subject deeper]
+2. [Suggest another relevant search term or related technology/concept]
+3. [Suggest a third area for deeper exploration related to this topic]
+
+Provide concrete, specific insights rather than generic summaries."""
+
+
+# Compiled once for parsing enhanced replies, instead of on every response.
+# Each match is one ENHANCED_SYSTEM_PROMPT section, with its body running up to the next header.
+# Models sometimes prefix or indent headers ("## KEY_POINTS:"), so any line naming a section ends a body.
+_SECTION_NAMES = r'(?:ARTICLE_SUMMARY|COMMENT_SUMMARY|KEY_POINTS|RELATED_LINKS)'
+_SECTION_RE = re.compile(
+    # The header's line break is left unconsumed, so an empty body can end at the very next line
+    rf'(?P<name>{_SECTION_NAMES}):[^\S\n]*(?=\n|$)'
+    rf'(?P<body>.*?)(?=\n[A-Z_]+:|\n[^\n]*?{_SECTION_NAMES}:|$)',
+    re.DOTALL,
+)
+NUMBERED_ITEM_RE = re.compile(r'\d+\.\s*(.*?)(?=\n\d+\.|\n[A-Z_]+:|$)', re.DOTALL)
+
+_HTML_TAG_RE = re.compile(r'<[^>]+>')
+
+
+def parse_sections(response_text: str) -> Dict[str, str]:
+    """Split an enhanced reply into its stripped section bodies in one pass; the first of a repeated section wins."""
+    sections: Dict[str, str] = {}
+    for match in _SECTION_RE.finditer(response_text):
+        sections.setdefault(match["name"], match["body"].strip())
+    return sections
+
+
+def create_summary_prompt(title: str, content: str) -> str:
+    """Create the per-article part of a 3-line summary request."""
+    return f"""Title: {title}
+Content: {content[:2000]}"""
+
+
+def create_comments_section(comments: List[HNComment]) -> str:
+    """Format the leading comments, with HTML tags removed, for an enhanced analysis request."""
+    comment_texts = [
+        f"Comment by {comment.by or 'Anonymous'}: {_HTML_TAG_RE.sub('', comment.text)[:500]}"
+        for comment in comments[:MAX_COMMENTS_FOR_SUMMARY]
+        if comment.text.strip()
+    ]
+    return "\n\n".join(comment_texts) if comment_texts else "No significant comments available."
+
+
+def create_enhanced_prompt(title: str, content: str, comments: str) -> str:
+    """Create the per-article part of an enhanced analysis request."""
+    return f"""ARTICLE:
+Title: {title}
+Content: {content[:3000]}
+
+DISCUSSION COMMENTS:
+{comments}"""
@@ -0,0 +1,85 @@
+"""
+Tests for the response cache.
+"""
+
+from hn_summarizer.cache import ResponseCache
+from hn_summarizer.llm_cache import LLMCache
+
+
+class TestResponseCache:
+    
+    def setup_method(self):
+        self.cache = ResponseCache(":memory:")
+    
+    def teardown_method(self):
+        self.cache.close()
+    
+    def test_miss_returns_none(self):
+        assert self.cache.get("missing") is None
+    
+    def test_set_and_get(self):
+        self.cache.set("key", "value", ttl=60)
+        
+        assert self.cache.get("key") == "value"
+    
+    def test_bytes_round_trip(self):
+        self.cache.set("page", b"<html></html>", ttl=60)
+        
+        assert self.cache.get("page") == b"<html></html>"
+    
+    def test_expired_entry(self):
+        self.cache.set("key", "value", ttl=-1)
+        
+        assert self.cache.get("key") is None
+        assert self.cache.get("key", allow_expired=True) == "value"
+    
+    def test_old_expired_entries_purged_on_open(self, tmp_path):
+        path = str(tmp_path / "responses.sqlite3")
+        cache = ResponseCache(path)
+        cache.set("fresh", "value", ttl=60)
+        cache.set("recently_expired", "value", ttl=-10)
+        cache.set("long_expired", "value", ttl=-1000)
+        cache.close()
+        
+        cache = ResponseCache(path, max_stale_age=100)
+        try:
+            assert cache.get("fresh") == "value"
+            assert cache.get("recently_expired", allow_expired=True) == "value"
+            assert cache.get("long_expired", allow_expired=True) is None
+        finally:
+            cache.close()
+    
+    def test_persists_to_disk(self, tmp_path):
+        path = str(tmp_path / "cache" / "responses.sqlite3")
+        cache = ResponseCache(path)
+        cache.set("key", "value", ttl=60)
+        cache.close()
+        
+        reopened = ResponseCache(path)
+        assert reopened.get("key") == "value"
+        reopened.close()
+    
+    def test_file_cache_uses_wal(self, tmp_path):
+        cache = ResponseCache(str(tmp_path / "responses.sqlite3"))
+        
+        mode = cache._conn.execute("PRAGMA journal_mode").fetchone()[0]
+        cache.close()
+        
+        assert mode == "wal"
+
+
+class TestLLMCache:
+    
+    def setup_method(self):
+        self.cache = LLMCache(ResponseCache(":memory:"))
+    
+    def test_round_trip(self):
+        self.cache.set("model-a", "prompt", "response")
+        
+        assert self.cache.get("model-a", "prompt") == "response"
+    
+    def test_key_depends_on_model(self):
+        self.cache.set("model-a", "prompt", "response")
+        
+        assert self.cache.get("model-b", "prompt") is None
+        assert LLMCache.make_key("model-a", "prompt") != LLMCache.make_key("model-b", "prompt")
@@ -0,0 +1,94 @@
+"""
+Tests for circuit breaking.
+"""
+
+import threading
+import pytest
+from unittest.mock import patch
+from hn_summarizer.circuit import CircuitBreaker, CircuitOpenError
+
+
+def fail(breaker, error=ConnectionError):
+    with pytest.raises(error):
+        with breaker:
+            raise error("down")
+
+
+def enter_or_error(breaker):
+    try:
+        with breaker:
+            return None
+    except CircuitOpenError as e:
+        return e
+
+
+class TestCircuitBreaker:
+
+    @patch('hn_summarizer.circuit.time.monotonic', return_value=100.0)
+    def test_opens_after_consecutive_failures(self, mock_monotonic):
+        breaker = CircuitBreaker("test", fail_max=2, reset_timeout=60, errors=(ConnectionError,))
+        fail(breaker)
+        fail(breaker)
+
+        with pytest.raises(CircuitOpenError):
+            with breaker:
+                pytest.fail("call ran while the circuit was open")
+
+    @patch('hn_summarizer.circuit.time.monotonic', return_value=100.0)
+    def test_success_resets_failure_count(self, mock_monotonic):
+        breaker = CircuitBreaker("test", fail_max=2, reset_timeout=60, errors=(ConnectionError,))
+        fail(breaker)
+        with breaker:
+            pass
+        fail(breaker)
+
+        with breaker:
+            pass
+
+    @patch('hn_summarizer.circuit.time.monotonic', return_value=100.0)
+    def test_other_errors_are_not_counted(self, mock_monotonic):
+        breaker = CircuitBreaker("test", fail_max=1, reset_timeout=60, errors=(ConnectionError,))
+        fail(breaker, ValueError)
+
+        with breaker:
+            pass
+
+    @patch('hn_summarizer.circuit.time.monotonic')
+    def test_only_one_trial_call_at_a_time(self, mock_monotonic):
+        breaker = CircuitBreaker("test", fail_max=1, reset_timeout=60, errors=(ConnectionError,))
+        mock_monotonic.return_value = 100.0
+        fail(breaker)
+        mock_monotonic.return_value = 161.0
+
+        with breaker:
+            # Another worker arriving while the trial runs still fails fast
+            results = []
+            worker = threading.Thread(target=lambda: results.append(enter_or_error(breaker)))
+            worker.start()
+            worker.join()
+        assert isinstance(results[0], CircuitOpenError)
+
+        with breaker:
+            pass
+
+    @patch('hn_summarizer.circuit.time.monotonic')
+    def test_trial_call_after_reset_timeout(self, mock_monotonic):
+        breaker = CircuitBreaker("test", fail_max=1, reset_timeout=60, errors=(ConnectionError,))
+        mock_monotonic.return_value = 100.0
+        fail(breaker)
+
+        # A failed trial reopens the circuit for another full timeout
+        mock_monotonic.return_value = 161.0
+        fail(breaker)
+        mock_monotonic.return_value = 200.0
+        with pytest.raises(CircuitOpenError):
+            with breaker:
+                pass
+
+        # A successful trial closes it
+        mock_monotonic.return_value = 222.0
+        with breaker:
+            pass
+        fail(breaker, ValueError)
+        with breaker:
+            pass
@@ -28,7 +28,7 @@ class TestCLI:
         result = self.runner.invoke(main)
 
         assert result.exit_code == 0
-        mock_summarizer_class.assert_called_once_with(mode="basic", ollama_model=None, allow_fallback=False)
+        mock_summarizer_class.assert_called_once_with(mode="basic", ollama_model=None, allow_fallback=False, use_cache=False)
         mock_summarizer.summarize_articles.assert_called_once_with(5)
         assert "Fetching top 5 Hacker News articles..." in result.output
         assert "--- Article 1 (Score: 100) ---" in result.output
@@ -204,6 +204,26 @@ class TestCLI:
         assert "--- Article 1 (Score: 100) ---" in result.output
         assert "Summary generation complete!" in result.output
 
+    @patch("hn_summarizer.cli.HackerNewsSummarizer")
+    def test_main_markdown_output(self, mock_summarizer_class):
+        mock_summarizer = Mock()
+        mock_summarizer_class.return_value = mock_summarizer
+        mock_summarizer.summarize_articles.return_value = [
+            {
+                "id": 1,
+                "title": "Pipes | in title",
+                "url": "https://example.com",
+                "score": 100,
+                "summary": ["Line 1", "Line 2"],
+            }
+        ]
+
+        result = self.runner.invoke(main, ["--output-format", "markdown", "--output", "-"])
+
+        assert result.exit_code == 0
+        assert "# Hacker News Article Summary\n\n| # | Title |" in result.output
+        assert "| 1 | Pipes \\| in title | 100 | Line 1 / Line 2 | https://example.com |\n" in result.output
+
     @patch("hn_summarizer.cli.HackerNewsSummarizer")
     def test_main_with_mode_option(self, mock_summarizer_class):
         mock_summarizer = Mock()
@@ -213,7 +233,7 @@ class TestCLI:
         result = self.runner.invoke(main, ["--mode", "ollama"])
 
         assert result.exit_code == 0
-        mock_summarizer_class.assert_called_once_with(mode="ollama", ollama_model=None, allow_fallback=False)
+        mock_summarizer_class.assert_called_once_with(mode="ollama", ollama_model=None, allow_fallback=False, use_cache=False)
 
     @patch("hn_summarizer.cli.HackerNewsSummarizer")
     def test_main_with_mode_short_option(self, mock_summarizer_class):
@@ -224,7 +244,7 @@ class TestCLI:
         result = self.runner.invoke(main, ["-m", "llmapi"])
 
         assert result.exit_code == 0
-        mock_summarizer_class.assert_called_once_with(mode="llmapi", ollama_model=None, allow_fallback=False)
+        mock_summarizer_class.assert_called_once_with(mode="llmapi", ollama_model=None, allow_fallback=False, use_cache=False)
 
     @patch("hn_summarizer.cli.HackerNewsSummarizer")
     def test_main_with_ollama_model_option(self, mock_summarizer_class):
@@ -235,7 +255,7 @@ class TestCLI:
         result = self.runner.invoke(main, ["--mode", "ollama", "--ollama-model", "llama3.2:7b"])
 
         assert result.exit_code == 0
-        mock_summarizer_class.assert_called_once_with(mode="ollama", ollama_model="llama3.2:7b", allow_fallback=False)
+        mock_summarizer_class.assert_called_once_with(mode="ollama", ollama_model="llama3.2:7b", allow_fallback=False, use_cache=False)
 
     @patch("hn_summarizer.cli.HackerNewsSummarizer")
     def test_main_with_fallback_option(self, mock_summarizer_class):
@@ -246,7 +266,18 @@ class TestCLI:
         result = self.runner.invoke(main, ["--mode", "ollama", "--fallback"])
 
         assert result.exit_code == 0
-        mock_summarizer_class.assert_called_once_with(mode="ollama", ollama_model=None, allow_fallback=True)
+        mock_summarizer_class.assert_called_once_with(mode="ollama", ollama_model=None, allow_fallback=True, use_cache=False)
+
+    @patch("hn_summarizer.cli.HackerNewsSummarizer")
+    def test_main_with_cache_option(self, mock_summarizer_class):
+        mock_summarizer = Mock()
+        mock_summarizer_class.return_value = mock_summarizer
+        mock_summarizer.summarize_articles.return_value = []
+
+        result = self.runner.invoke(main, ["--cache"])
+
+        assert result.exit_code == 0
+        mock_summarizer_class.assert_called_once_with(mode="basic", ollama_model=None, allow_fallback=False, use_cache=True)
 
     @patch("hn_summarizer.cli.HackerNewsSummarizer")
     def test_main_error_handling_without_fallback(self, mock_summarizer_class):
@@ -2,10 +2,22 @@
 Tests for the fetchers module.
 """
 
+import orjson
+import pytest
 import requests
 from unittest.mock import Mock, patch
-from hn_summarizer.fetchers import HackerNewsAPI, ContentExtractor
-from hn_summarizer.models import HNStory, HNComment
+from selectolax.lexbor import LexborHTMLParser
+from hn_summarizer.cache import ResponseCache
+from hn_summarizer.fetchers import HackerNewsAPI, ContentExtractor, _RATE_LIMITER
+from hn_summarizer.config import HTTP_RETRIES
+from hn_summarizer.models import HNStory, HNComment, ArticleContent
+
+
+@pytest.fixture(autouse=True)
+def no_rate_limit():
+    # Requests are mocked, so don't spend wall time on per-host politeness
+    with patch.object(_RATE_LIMITER, 'wait', return_value=0.0):
+        yield
 
 
 class TestHackerNewsAPI:
@@ -16,7 +28,7 @@ class TestHackerNewsAPI:
     @patch('hn_summarizer.fetchers.requests.Session.get')
     def test_get_top_story_ids_success(self, mock_get):
         mock_response = Mock()
-        mock_response.json.return_value = [1, 2, 3, 4, 5, 6, 7, 8, 9, 10]
+        mock_response.content = orjson.dumps([1, 2, 3, 4, 5, 6, 7, 8, 9, 10])
         mock_response.raise_for_status.return_value = None
         mock_get.return_value = mock_response
         
@@ -36,7 +48,7 @@ class TestHackerNewsAPI:
     @patch('hn_summarizer.fetchers.requests.Session.get')
     def test_get_story_details_success(self, mock_get):
         mock_response = Mock()
-        mock_response.json.return_value = {
+        mock_response.content = orjson.dumps({
             "id": 123,
             "title": "Test Article",
             "url": "https://example.com",
@@ -44,7 +56,7 @@ class TestHackerNewsAPI:
             "by": "testuser",
             "time": 1234567890,
             "type": "story"
-        }
+        })
         mock_response.raise_for_status.return_value = None
         mock_get.return_value = mock_response
         
@@ -56,6 +68,7 @@ class TestHackerNewsAPI:
         assert result.url == "https://example.com"
         assert result.score == 100
         assert result.by == "testuser"
+        assert result.kids == []
     
     @patch('hn_summarizer.fetchers.requests.Session.get')
     def test_get_story_details_error(self, mock_get):
@@ -65,16 +78,112 @@ class TestHackerNewsAPI:
         
         assert result is None
     
+    @patch('hn_summarizer.fetchers.requests.Session.get')
+    def test_get_story_details_non_json_body(self, mock_get):
+        mock_response = Mock()
+        mock_response.content = b"<html>proxy error</html>"
+        mock_response.raise_for_status.return_value = None
+        mock_get.return_value = mock_response
+        
+        result = self.api.get_story_details(123)
+        
+        assert result is None
+    
+    def test_get_stories_bulk_preserves_order(self):
+        def fake_details(story_id):
+            if story_id == 2:
+                return None
+            return HNStory(id=story_id, title=f"Story {story_id}")
+        
+        with patch.object(self.api, 'get_story_details', side_effect=fake_details):
+            result = self.api.get_stories_bulk([3, 2, 1])
+        
+        assert [story.id if story else None for story in result] == [3, None, 1]
+    
+    def test_bulk_fetches_isolate_worker_errors(self):
+        def fake_details(story_id):
+            if story_id == 2:
+                raise ValueError("bad item")
+            return HNStory(id=story_id, title=f"Story {story_id}")
+        
+        def fake_comment(comment_id):
+            if comment_id == 20:
+                raise ValueError("bad item")
+            return HNComment(id=comment_id, text=f"Comment {comment_id}")
+        
+        with patch.object(self.api, 'get_story_details', side_effect=fake_details), \
+             patch.object(self.api, 'get_comment', side_effect=fake_comment):
+            stories = self.api.get_stories_bulk([3, 2, 1])
+            comment_lists = self.api.get_top_comments_bulk(
+                [HNStory(id=1, title="One", kids=[10, 20]), HNStory(id=3, title="Three", kids=[30])]
+            )
+        
+        assert [story.id if story else None for story in stories] == [3, None, 1]
+        assert [[comment.id for comment in comments] for comments in comment_lists] == [[10], [30]]
+    
+    def test_get_comments_bulk_filters_and_preserves_order(self):
+        def fake_comment(comment_id):
+            if comment_id == 2:
+                return None
+            text = "" if comment_id == 4 else f"Comment {comment_id}"
+            return HNComment(id=comment_id, text=text)
+        
+        with patch.object(self.api, 'get_comment', side_effect=fake_comment):
+            result = self.api.get_comments_bulk([5, 2, 4, 1])
+        
+        assert [comment.id for comment in result] == [5, 1]
+    
+    def test_get_top_comments_uses_story_kids(self):
+        story = HNStory(id=1, title="Story", kids=[10, 11, 12])
+        
+        with patch.object(self.api, 'get_story_details') as mock_details, \
+             patch.object(self.api, 'get_comments_bulk', return_value=[]) as mock_bulk:
+            self.api.get_top_comments(story, max_comments=2)
+        
+        mock_details.assert_not_called()
+        mock_bulk.assert_called_once_with([10, 11])
+    
+    def test_get_top_comments_bulk_splits_per_story(self):
+        stories = [
+            HNStory(id=1, title="One", kids=[10, 11, 12]),
+            HNStory(id=2, title="Two", kids=[]),
+            HNStory(id=3, title="Three", kids=[30, 31]),
+        ]
+        
+        def fake_comment(comment_id):
+            return None if comment_id == 11 else HNComment(id=comment_id, text=f"Comment {comment_id}")
+        
+        with patch.object(self.api, 'get_comment', side_effect=fake_comment) as mock_comment:
+            result = self.api.get_top_comments_bulk(stories, max_comments=2)
+        
+        assert [[comment.id for comment in comments] for comments in result] == [[10], [], [30, 31]]
+        assert mock_comment.call_count == 4
+    
+    def test_get_stories_bulk_empty(self):
+        assert self.api.get_stories_bulk([]) == []
+    
+    @patch('hn_summarizer.fetchers.requests.Session.get')
+    def test_item_lookups_are_memoized(self, mock_get):
+        mock_response = Mock()
+        mock_response.content = orjson.dumps({"id": 123, "title": "Test Article", "type": "story"})
+        mock_response.raise_for_status.return_value = None
+        mock_get.return_value = mock_response
+        
+        self.api.get_story_details(123)
+        self.api.get_story_with_comments(123)
+        
+        mock_get.assert_called_once()
+    
     @patch('hn_summarizer.fetchers.requests.Session.get')
     def test_get_comment_success(self, mock_get):
         mock_response = Mock()
-        mock_response.json.return_value = {
+        mock_response.content = orjson.dumps({
             "id": 456,
             "by": "commenter",
             "text": "This is a comment",
             "time": 1234567890,
             "type": "comment"
-        }
+        })
         mock_response.raise_for_status.return_value = None
         mock_get.return_value = mock_response
         
@@ -97,7 +206,7 @@ class TestHackerNewsAPI:
     def test_get_story_with_comments_success(self, mock_get):
         # Mock story response
         story_response = Mock()
-        story_response.json.return_value = {
+        story_response.content = orjson.dumps({
             "id": 123,
             "title": "Test Article",
             "url": "https://example.com",
@@ -106,31 +215,33 @@ class TestHackerNewsAPI:
             "time": 1234567890,
             "type": "story",
             "kids": [456, 789]
-        }
+        })
         story_response.raise_for_status.return_value = None
         
         # Mock comment responses
         comment1_response = Mock()
-        comment1_response.json.return_value = {
+        comment1_response.content = orjson.dumps({
             "id": 456,
             "by": "commenter1",
             "text": "First comment",
             "time": 1234567891,
             "type": "comment"
-        }
+        })
         comment1_response.raise_for_status.return_value = None
         
         comment2_response = Mock()
-        comment2_response.json.return_value = {
+        comment2_response.content = orjson.dumps({
             "id": 789,
             "by": "commenter2", 
             "text": "Second comment",
             "time": 1234567892,
             "type": "comment"
-        }
+        })
         comment2_response.raise_for_status.return_value = None
         
-        mock_get.side_effect = [story_response, comment1_response, comment2_response]
+        # Comments are fetched concurrently, so route responses by URL rather than call order
+        responses = {"123": story_response, "456": comment1_response, "789": comment2_response}
+        mock_get.side_effect = lambda url, **kwargs: responses[url.rsplit("/", 1)[-1].split(".")[0]]
         
         result = self.api.get_story_with_comments(123, max_comments=2)
         
@@ -146,7 +257,7 @@ class TestHackerNewsAPI:
     def test_get_story_with_comments_no_comments(self, mock_get):
         # Mock story response without kids
         story_response = Mock()
-        story_response.json.return_value = {
+        story_response.content = orjson.dumps({
             "id": 123,
             "title": "Test Article",
             "url": "https://example.com",
@@ -154,7 +265,7 @@ class TestHackerNewsAPI:
             "by": "testuser",
             "time": 1234567890,
             "type": "story"
-        }
+        })
         story_response.raise_for_status.return_value = None
         mock_get.return_value = story_response
         
@@ -165,6 +276,50 @@ class TestHackerNewsAPI:
         assert isinstance(story, HNStory)
         assert len(comments) == 0
 
+    
+    @patch('hn_summarizer.fetchers.requests.Session.get')
+    def test_get_story_details_uses_cache(self, mock_get):
+        cache = ResponseCache(":memory:")
+        mock_response = Mock()
+        mock_response.content = orjson.dumps({"id": 123, "title": "Cached Article", "score": 10})
+        mock_response.headers = {}
+        mock_response.raise_for_status.return_value = None
+        mock_get.return_value = mock_response
+        
+        first = HackerNewsAPI(cache=cache).get_story_details(123)
+        second = HackerNewsAPI(cache=cache).get_story_details(123)
+        
+        assert first.title == second.title == "Cached Article"
+        mock_get.assert_called_once()
+    
+    @patch('hn_summarizer.fetchers.requests.Session.get')
+    def test_get_top_story_ids_revalidates_with_etag(self, mock_get):
+        cache = ResponseCache(":memory:")
+        api = HackerNewsAPI(cache=cache)
+        url = f"{api.base_url}/topstories.json"
+        cache.set(url, "[7, 8, 9]", ttl=-1)
+        cache.set(f"etag:{url}", '"abc"', ttl=-1)
+        mock_response = Mock(status_code=304)
+        mock_response.raise_for_status.return_value = None
+        mock_get.return_value = mock_response
+        
+        result = api.get_top_story_ids(2)
+        
+        assert result == [7, 8]
+        assert mock_get.call_args.kwargs["headers"] == {"If-None-Match": '"abc"'}
+        assert cache.get(url) is not None
+    
+    @patch('hn_summarizer.fetchers.requests.Session.get')
+    def test_get_top_story_ids_stale_cache_on_error(self, mock_get):
+        cache = ResponseCache(":memory:")
+        api = HackerNewsAPI(cache=cache)
+        cache.set(f"{api.base_url}/topstories.json", "[7, 8, 9]", ttl=-1)
+        mock_get.side_effect = requests.RequestException("Network error")
+        
+        result = api.get_top_story_ids(2)
+        
+        assert result == [7, 8]
+
 
 class TestContentExtractor:
     
@@ -187,7 +342,7 @@ class TestContentExtractor:
         story = HNStory(id=123, title="Test Article", url="https://example.com")
         
         mock_response = Mock()
-        mock_response.content = b'''
+        mock_response.iter_content.return_value = [b'''
         <html>
             <body>
                 <article>
@@ -197,7 +352,8 @@ class TestContentExtractor:
                 <script>Should be removed</script>
             </body>
         </html>
-        '''
+        ''']
+        mock_response.headers = {"Content-Type": "text/html; charset=utf-8"}
         mock_response.raise_for_status.return_value = None
         mock_get.return_value = mock_response
         
@@ -210,6 +366,172 @@ class TestContentExtractor:
         assert result.url == "https://example.com"
         assert result.extracted_successfully == True
     
+    @patch('hn_summarizer.fetchers.requests.Session.get')
+    def test_extract_content_body_fallback(self, mock_get):
+        story = HNStory(id=123, title="Test Article", url="https://example.com")
+        
+        mock_response = Mock()
+        mock_response.iter_content.return_value = [
+            '<html><head><meta charset="iso-8859-1"><style>p {}</style></head>'
+            '<body><nav>Home | About</nav><p>Caf\xe9   menu</p><script>track()</script>'
+            '<footer>Copyright</footer></body></html>'.encode("latin-1")
+        ]
+        mock_response.headers = {"Content-Type": "text/html"}
+        mock_response.raise_for_status.return_value = None
+        mock_get.return_value = mock_response
+        
+        result = self.extractor.extract_content(story)
+        
+        assert result.content == "Caf\xe9 menu"
+        assert result.extracted_successfully == True
+    
+    @patch('hn_summarizer.fetchers.requests.Session.get')
+    def test_extract_content_caches_extracted_text(self, mock_get):
+        story = HNStory(id=123, title="Test Article", url="https://example.com")
+        mock_response = Mock()
+        mock_response.iter_content.return_value = [b'<html><body><article><p>Cached text</p></article></body></html>']
+        mock_response.headers = {"Content-Type": "text/html"}
+        mock_response.raise_for_status.return_value = None
+        mock_get.return_value = mock_response
+        extractor = ContentExtractor(cache=ResponseCache(":memory:"))
+        
+        first = extractor.extract_content(story)
+        with patch('hn_summarizer.fetchers.LexborHTMLParser') as mock_parser:
+            second = extractor.extract_content(story)
+        
+        assert first.content == second.content == "Cached text"
+        assert second.extracted_successfully == True
+        mock_get.assert_called_once()
+        mock_parser.assert_not_called()
+    
+    @patch('hn_summarizer.fetchers.requests.Session.get')
+    def test_extract_content_uses_plain_text_unparsed(self, mock_get):
+        story = HNStory(id=123, title="Notes", url="https://example.com/notes.txt")
+        mock_response = Mock()
+        mock_response.iter_content.return_value = [b"First line.\n\n  Second line, 1 < 2.\n"]
+        mock_response.headers = {"Content-Type": "text/plain; charset=utf-8"}
+        mock_response.raise_for_status.return_value = None
+        mock_get.return_value = mock_response
+        
+        with patch('hn_summarizer.fetchers.LexborHTMLParser') as mock_parser:
+            result = self.extractor.extract_content(story)
+        
+        assert result.content == "First line. Second line, 1 < 2."
+        assert result.extracted_successfully == True
+        mock_parser.assert_not_called()
+    
+    @patch('hn_summarizer.fetchers.requests.Session.get')
+    def test_extract_content_plain_text_charsets(self, mock_get):
+        text = "Café crème, naïve résumé à la carte, déjà vu. " * 4
+        story = HNStory(id=123, title="Notes", url="https://example.com/notes.txt")
+        mock_response = Mock()
+        mock_response.iter_content.return_value = [text.encode("latin-1")]
+        mock_response.raise_for_status.return_value = None
+        mock_get.return_value = mock_response
+        
+        mock_response.headers = {"Content-Type": "text/plain; charset=ISO-8859-1"}
+        declared = self.extractor.extract_content(story)
+        # Without a declared charset the encoding is detected, which may pick a close relative of Latin-1
+        mock_response.headers = {"Content-Type": "text/plain"}
+        detected = self.extractor.extract_content(story)
+        
+        assert declared.content == text.strip()
+        assert "\ufffd" not in detected.content
+        assert detected.content.startswith("Café")
+    
+    @patch('hn_summarizer.fetchers.requests.Session.get')
+    def test_extract_content_skips_binary_url_without_request(self, mock_get):
+        story = HNStory(id=123, title="Paper", url="https://example.com/files/Paper.PDF?download=1")
+        
+        result = self.extractor.extract_content(story)
+        
+        assert result.extracted_successfully == False
+        assert result.error_message == "Non-HTML content"
+        mock_get.assert_not_called()
+    
+    @patch('hn_summarizer.fetchers.requests.Session.get')
+    def test_extract_content_stale_non_html_entry_on_error(self, mock_get):
+        cache = ResponseCache(":memory:")
+        extractor = ContentExtractor(cache=cache)
+        story = HNStory(id=123, title="Paper", url="https://example.com/paper")
+        cache.set(story.url, b"", ttl=-1)
+        mock_get.side_effect = requests.ConnectionError("Host down")
+        
+        result = extractor.extract_content(story)
+        
+        assert result.extracted_successfully == False
+        assert result.error_message == "Non-HTML content"
+        assert cache.get(f"text:{story.url}") is None
+    
+    @patch('hn_summarizer.fetchers.requests.Session.get')
+    def test_extract_content_skips_non_html(self, mock_get):
+        story = HNStory(id=123, title="Paper", url="https://example.com/paper.pdf")
+        mock_response = Mock()
+        mock_response.headers = {"Content-Type": "application/pdf"}
+        mock_response.raise_for_status.return_value = None
+        mock_get.return_value = mock_response
+        
+        result = self.extractor.extract_content(story)
+        
+        assert result.extracted_successfully == False
+        assert result.error_message == "Non-HTML content"
+        mock_response.iter_content.assert_not_called()
+    
+    @patch('hn_summarizer.fetchers.MAX_HTML_BYTES', 10)
+    def test_read_body_stops_at_limit(self):
+        response = Mock()
+        response.iter_content.return_value = iter([b"12345678", b"abcdefgh", b"never read"])
+        
+        body = self.extractor._read_body(response)
+        
+        assert body == b"12345678ab"
+    
+    def test_clean_content_normalizes_whitespace_and_truncates(self):
+        assert self.extractor._clean_content("  a \n\t b  c ") == "a b c"
+        
+        with patch('hn_summarizer.fetchers.MAX_CONTENT_LENGTH', 10):
+            assert self.extractor._clean_content("word " * 100) == "word word "
+            # A prefix that is almost all whitespace still yields a full-length result
+            assert self.extractor._clean_content(" " * 100 + "x " * 20) == "x x x x x "
+    
+    def test_main_content_separates_adjacent_blocks(self):
+        tree = LexborHTMLParser('<article><h1>Title</h1><p>First</p><p>Second</p></article>')
+        
+        content = self.extractor._clean_content(self.extractor._extract_main_content(tree))
+        
+        assert content == "Title First Second"
+    
+    def test_main_content_selector_priority(self):
+        tree = LexborHTMLParser(
+            '<div class="content">Wrapper <article>Article body</article></div>'
+        )
+        
+        assert self.extractor._extract_main_content(tree) == "Article body"
+    
+    def test_session_shared_with_hn_api(self):
+        """Test that both clients reuse one pooled session unless one is injected."""
+        assert self.extractor.session is HackerNewsAPI().session
+        
+        custom = requests.Session()
+        assert ContentExtractor(session=custom).session is custom
+    
+    def test_shared_session_retries_transient_errors(self):
+        adapter = self.extractor.session.get_adapter("https://example.com")
+        
+        assert adapter.max_retries.total == HTTP_RETRIES
+        assert 503 in adapter.max_retries.status_forcelist
+    
+    def test_extract_many_preserves_order(self):
+        stories = [HNStory(id=i, title=f"Story {i}", url=f"https://example.com/{i}") for i in range(3)]
+        
+        def fake_extract(story):
+            return ArticleContent(title=story.title, content=f"Body {story.id}", url=story.url)
+        
+        with patch.object(self.extractor, 'extract_content', side_effect=fake_extract):
+            result = self.extractor.extract_many(stories)
+        
+        assert [content.content for content in result] == ["Body 0", "Body 1", "Body 2"]
+    
     @patch('hn_summarizer.fetchers.requests.Session.get')
     def test_extract_content_error(self, mock_get):
         story = HNStory(id=123, title="Test Article", url="https://example.com")
@@ -0,0 +1,48 @@
+"""
+Tests for the logging configuration module.
+"""
+
+import logging
+import pytest
+from hn_summarizer.logging_config import log_performance, setup_logging, stop_logging
+
+
+class TestLogPerformance:
+
+    def setup_method(self):
+        self.logger = logging.getLogger("test_log_performance")
+
+    def test_logs_timing_at_info(self, caplog):
+        @log_performance(self.logger, "test operation")
+        def work():
+            return 42
+
+        with caplog.at_level(logging.INFO, logger=self.logger.name):
+            assert work() == 42
+
+        assert "Completed test operation in" in caplog.text
+
+    def test_skips_timing_when_info_disabled(self, caplog):
+        @log_performance(self.logger, "test operation")
+        def fail():
+            raise ValueError("boom")
+
+        with caplog.at_level(logging.WARNING, logger=self.logger.name):
+            with pytest.raises(ValueError):
+                fail()
+
+        assert "Completed" not in caplog.text
+        assert "Failed test operation: boom" in caplog.text
+
+
+class TestSetupLogging:
+
+    def test_records_written_by_background_listener(self, tmp_path):
+        log_file = tmp_path / "run.log"
+        setup_logging(level="INFO", log_file=str(log_file))
+        try:
+            logging.getLogger("test_setup_logging").info("queued message")
+        finally:
+            stop_logging()
+
+        assert "queued message" in log_file.read_text()
@@ -2,9 +2,11 @@
 Tests for the modularized HN Summarizer structure.
 """
 
+import time
 from unittest.mock import Mock, patch
 from hn_summarizer import HackerNewsSummarizer
-from hn_summarizer.models import SummarizerMode, HNStory, ArticleContent
+from hn_summarizer.config import SUMMARY_LRU_TTL
+from hn_summarizer.models import SummarizerMode, HNStory, ArticleContent, EnhancedSummary
 from hn_summarizer.fetchers import HackerNewsAPI, ContentExtractor
 from hn_summarizer.summarizers import BasicSummarizer
 
@@ -50,6 +52,16 @@ class TestModularHackerNewsSummarizer:
             assert result == mock_story
             mock_method.assert_called_once_with(123)
     
+    def test_get_stories_bulk_delegation(self):
+        with patch.object(self.summarizer.api_client, 'get_stories_bulk') as mock_method:
+            mock_stories = [HNStory(id=1, title="One"), None]
+            mock_method.return_value = mock_stories
+            
+            result = self.summarizer.get_stories_bulk([1, 2])
+            
+            assert result == mock_stories
+            mock_method.assert_called_once_with([1, 2])
+    
     def test_extract_article_content_delegation(self):
         with patch.object(self.summarizer.content_extractor, 'extract_content') as mock_method:
             mock_story = HNStory(id=123, title="Test", url="https://example.com")
@@ -76,17 +88,17 @@ class TestModularHackerNewsSummarizer:
     def test_summarize_articles_integration(self, mock_sleep):
         # Mock the individual components
         with patch.object(self.summarizer, 'get_top_stories') as mock_get_stories, \
-             patch.object(self.summarizer, 'get_story_details') as mock_get_details, \
-             patch.object(self.summarizer, 'extract_article_content') as mock_extract, \
+             patch.object(self.summarizer, 'get_stories_bulk') as mock_get_details, \
+             patch.object(self.summarizer, 'extract_articles_content') as mock_extract, \
              patch.object(self.summarizer, 'generate_summary') as mock_summarize:
             
             # Setup mocks
             mock_get_stories.return_value = [1]
             mock_story = HNStory(id=1, title="Test Article", url="https://example.com", score=100)
-            mock_get_details.return_value = mock_story
+            mock_get_details.return_value = [mock_story]
             
             mock_content = ArticleContent(title="Test Article", content="Test content", url="https://example.com")
-            mock_extract.return_value = mock_content
+            mock_extract.return_value = [mock_content]
             
             mock_summarize.return_value = ["Summary line 1", "Summary line 2", "Summary line 3"]
             
@@ -103,10 +115,81 @@ class TestModularHackerNewsSummarizer:
             
             # Verify method calls
             mock_get_stories.assert_called_once_with(1)
-            mock_get_details.assert_called_once_with(1)
-            mock_extract.assert_called_once_with(mock_story)
+            mock_get_details.assert_called_once_with([1])
+            mock_extract.assert_called_once_with([mock_story])
             mock_summarize.assert_called_once_with(mock_content)
-            mock_sleep.assert_called_once()
+            mock_sleep.assert_not_called()
+
+    
+    def test_summarize_articles_reuses_recent_summaries(self):
+        stories = {sid: HNStory(id=sid, title=f"Story {sid}", url=f"https://example.com/{sid}") for sid in [1, 2]}
+        content = ArticleContent(title="Story", content="Test content", url="https://example.com")
+        
+        with patch.object(self.summarizer, 'get_top_stories', side_effect=[[1], [2, 1]]), \
+             patch.object(self.summarizer, 'get_stories_bulk',
+                          side_effect=lambda ids: [stories[sid] for sid in ids]) as mock_bulk, \
+             patch.object(self.summarizer, 'extract_articles_content',
+                          side_effect=lambda batch: [content] * len(batch)), \
+             patch.object(self.summarizer, 'generate_summary', return_value=["a", "b", "c"]):
+            first = self.summarizer.summarize_articles(1)
+            second = self.summarizer.summarize_articles(2)
+        
+        assert [article['id'] for article in second] == [2, 1]
+        assert second[1] is first[0]
+        assert mock_bulk.call_args_list[1].args == ([2],)
+    
+    def test_cached_summary_expires(self):
+        self.summarizer._cache_summary({"id": 1, "summary": []})
+        
+        with patch('hn_summarizer.summarizer.time.monotonic', return_value=time.monotonic() + SUMMARY_LRU_TTL + 1):
+            assert self.summarizer._get_cached_summary(1) is None
+        assert 1 not in self.summarizer._summaries
+    
+    def test_fallback_summaries_are_not_reused(self):
+        summarizer = HackerNewsSummarizer(mode="ollama")
+        stories = [HNStory(id=sid, title=f"Story {sid}", url=f"https://example.com/{sid}") for sid in [1, 2]]
+        content = ArticleContent(title="Story", content="Test content", url="https://example.com")
+        outcomes = [
+            EnhancedSummary("Article", "Discussion", ["A"], ["L"], "https://example.com/1", "hn/1"),
+            EnhancedSummary("Article", "Discussion", ["A"], ["L"], "https://example.com/2", "hn/2",
+                            fallback_used=True),
+        ]
+        
+        with patch.object(summarizer, 'get_top_stories', return_value=[1, 2]), \
+             patch.object(summarizer, 'get_stories_bulk', return_value=stories), \
+             patch.object(summarizer.api_client, 'get_top_comments_bulk', return_value=[[], []]), \
+             patch.object(summarizer, 'extract_articles_content', return_value=[content, content]), \
+             patch.object(summarizer.summarizer, 'enhanced_summarize_batch', return_value=outcomes):
+            result = summarizer.summarize_articles(2)
+        
+        assert [article['id'] for article in result] == [1, 2]
+        assert list(summarizer._summaries) == [1]
+    
+    def test_summarize_articles_enhanced_batches_llm_calls(self):
+        summarizer = HackerNewsSummarizer(mode="ollama")
+        stories = {
+            sid: HNStory(id=sid, title=f"Story {sid}", url=f"https://example.com/{sid}", score=sid)
+            for sid in [1, 2, 3]
+        }
+        content = ArticleContent(title="Story", content="Test content", url="https://example.com")
+        enhanced = Mock(article_summary="Article", comment_summary="Discussion", key_points=["A", "B"],
+                        fallback_used=False)
+        
+        with patch.object(summarizer, 'get_top_stories', return_value=[1, 2, 3]), \
+             patch.object(summarizer, 'get_stories_bulk',
+                          return_value=[stories[1], stories[2], stories[3]]) as mock_bulk, \
+             patch.object(summarizer.api_client, 'get_top_comments_bulk', return_value=[[], [], []]), \
+             patch.object(summarizer, 'extract_articles_content', return_value=[content] * 3), \
+             patch.object(summarizer.summarizer, 'enhanced_summarize_batch',
+                          return_value=[enhanced, RuntimeError("LLM down"), enhanced]) as mock_batch:
+            
+            result = summarizer.summarize_articles(3)
+        
+        mock_bulk.assert_called_once_with([1, 2, 3])
+        mock_batch.assert_called_once_with([(content, [], 1), (content, [], 2), (content, [], 3)])
+        assert [article['id'] for article in result] == [1, 3]
+        assert result[0]['enhanced'] is enhanced
+        assert result[0]['summary'][0] == "Article: Article"
 
 
 class TestHNStoryModel:
@@ -134,6 +217,12 @@ class TestHNStoryModel:
         assert story.url is None
         assert story.score == 0
         assert story.type == "story"
+        assert story.kids is None
+    
+    def test_hn_story_uses_slots(self):
+        story = HNStory(id=123, title="Test")
+        
+        assert not hasattr(story, "__dict__")
 
 
 class TestArticleContentModel:
@@ -0,0 +1,47 @@
+"""
+Tests for per-host rate limiting.
+"""
+
+from unittest.mock import patch
+from hn_summarizer.ratelimit import HostRateLimiter
+
+
+class TestHostRateLimiter:
+    
+    @patch('hn_summarizer.ratelimit.time.sleep')
+    @patch('hn_summarizer.ratelimit.time.monotonic', return_value=100.0)
+    def test_burst_then_waits(self, mock_monotonic, mock_sleep):
+        limiter = HostRateLimiter(rate=2)
+        
+        waits = [limiter.wait("https://example.com/page") for _ in range(3)]
+        
+        assert waits == [0.0, 0.0, 0.5]
+        mock_sleep.assert_called_once_with(0.5)
+    
+    @patch('hn_summarizer.ratelimit.time.sleep')
+    @patch('hn_summarizer.ratelimit.time.monotonic', return_value=100.0)
+    def test_hosts_have_separate_buckets(self, mock_monotonic, mock_sleep):
+        limiter = HostRateLimiter(rate=1)
+        
+        assert limiter.wait("https://a.example/1") == 0.0
+        assert limiter.wait("https://b.example/1") == 0.0
+        mock_sleep.assert_not_called()
+    
+    @patch('hn_summarizer.ratelimit.time.sleep')
+    @patch('hn_summarizer.ratelimit.time.monotonic')
+    def test_tokens_refill_over_time(self, mock_monotonic, mock_sleep):
+        limiter = HostRateLimiter(rate=1)
+        mock_monotonic.return_value = 100.0
+        limiter.wait("https://example.com/1")
+        mock_monotonic.return_value = 101.0
+        
+        assert limiter.wait("https://example.com/2") == 0.0
+    
+    @patch('hn_summarizer.ratelimit.time.sleep')
+    @patch('hn_summarizer.ratelimit.time.monotonic', return_value=100.0)
+    def test_host_rate_override(self, mock_monotonic, mock_sleep):
+        limiter = HostRateLimiter(rate=1, host_rates={"api.example": 20})
+        
+        waits = [limiter.wait("https://api.example/item") for _ in range(20)]
+        
+        assert waits == [0.0] * 20
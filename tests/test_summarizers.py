@@ -2,9 +2,16 @@
 Tests for the summarizers package.
 """
 
+import re
+import orjson
+import requests
 from unittest.mock import patch, Mock
 from hn_summarizer.models import SummarizerMode, SummarizerConfig, ArticleContent, HNComment, EnhancedSummary
 from hn_summarizer.summarizers import BasicSummarizer, OllamaSummarizer, LLMAPISummarizer
+from hn_summarizer.cache import ResponseCache
+from hn_summarizer.llm_cache import LLMCache
+from hn_summarizer.config import MIN_SENTENCE_LENGTH, MAX_LINE_LENGTH, LLM_CIRCUIT_FAILURES, OPENAI_TIMEOUT
+from hn_summarizer.summarizers.prompts import SUMMARY_SYSTEM_PROMPT, create_comments_section, parse_sections
 
 
 class TestBasicSummarizer:
@@ -27,6 +34,33 @@ class TestBasicSummarizer:
         assert "first sentence" in result[1]
         assert "second sentence" in result[2]
     
+    def test_extract_sentences_matches_split_and_honours_limit(self):
+        text = "Short. This sentence is long enough to keep!! Tiny? Another sentence that is long enough... And the final long sentence here"
+        expected = [
+            s.strip() for s in re.split(r'[.!?]+', text)
+            if len(s.strip()) > MIN_SENTENCE_LENGTH
+        ]
+        
+        assert self.summarizer._extract_sentences(text) == expected
+        assert self.summarizer._extract_sentences(text, limit=2) == expected[:2]
+    
+    def test_create_summary_lines_truncates_and_fills_defaults(self):
+        long_sentence = "word " * 100
+        
+        lines = self.summarizer._create_summary_lines("Title", [long_sentence], "https://example.com")
+        
+        assert lines[0] == "Article: Title"
+        assert lines[1] == long_sentence[:MAX_LINE_LENGTH] + "..."
+        assert lines[2] == "URL: https://example.com"
+        assert self.summarizer._create_summary_lines("Title", [], "u")[1:] == ["No content available.", "URL: u"]
+    
+    def test_ensure_line_count_returns_clean_lines_unchanged(self):
+        content = ArticleContent(title="Title", content="Text", url="https://example.com")
+        lines = ["One", "Two", "Three"]
+        
+        assert self.summarizer._ensure_line_count(lines, content) is lines
+        assert self.summarizer._ensure_line_count([" One", "Two", "Three"], content) == lines
+    
     def test_summarize_without_content(self):
         content = ArticleContent(
             title="Test Article",
@@ -56,6 +90,91 @@ class TestBasicSummarizer:
         assert len(result[2]) < len(long_url)
 
 
+class TestSummarizeBatch:
+    
+    def test_batch_preserves_order_and_captures_errors(self):
+        config = SummarizerConfig(mode=SummarizerMode.OLLAMA, allow_fallback=False)
+        summarizer = OllamaSummarizer(config)
+        contents = [
+            ArticleContent(title=f"Article {i}", content=f"Content {i}", url="https://example.com")
+            for i in range(5)
+        ]
+        
+        def fake_summarize(content):
+            if content.title == "Article 2":
+                raise RuntimeError("boom")
+            return [content.title]
+        
+        with patch.object(summarizer, 'summarize', side_effect=fake_summarize):
+            results = summarizer.summarize_batch(contents)
+        
+        assert summarizer.max_workers > 1
+        assert results[:2] == [["Article 0"], ["Article 1"]]
+        assert isinstance(results[2], RuntimeError)
+        assert results[3:] == [["Article 3"], ["Article 4"]]
+
+
+class TestCreateCommentsSection:
+    
+    def test_strips_tags_and_skips_blank_comments(self):
+        comments = [
+            HNComment(id=1, text="<p>Great <i>point</i></p>", by="alice"),
+            HNComment(id=2, text="   "),
+            HNComment(id=3, text="No author"),
+        ]
+        
+        section = create_comments_section(comments)
+        
+        assert section == "Comment by alice: Great point\n\nComment by Anonymous: No author"
+    
+    def test_no_comments(self):
+        assert create_comments_section([]) == "No significant comments available."
+
+
+class TestParseSections:
+    
+    def test_splits_sections_in_one_pass(self):
+        text = "ARTICLE_SUMMARY:\nAbout X.\n\nCOMMENT_SUMMARY:\r\nPeople agree.\n\nKEY_POINTS:\n1. One\n2. Two"
+        
+        sections = parse_sections(text)
+        
+        assert sections["ARTICLE_SUMMARY"] == "About X."
+        assert sections["COMMENT_SUMMARY"] == "People agree."
+        assert sections["KEY_POINTS"] == "1. One\n2. Two"
+        assert "RELATED_LINKS" not in sections
+    
+    def test_prefixed_and_indented_headers(self):
+        for prefix in ("## ", "  "):
+            text = "\n".join(
+                f"{prefix}{name}:\n{name.lower()} body\n"
+                for name in ("ARTICLE_SUMMARY", "COMMENT_SUMMARY", "KEY_POINTS", "RELATED_LINKS")
+            )
+            
+            sections = parse_sections(text)
+            
+            assert sections == {
+                "ARTICLE_SUMMARY": "article_summary body",
+                "COMMENT_SUMMARY": "comment_summary body",
+                "KEY_POINTS": "key_points body",
+                "RELATED_LINKS": "related_links body",
+            }
+    
+    def test_empty_section_does_not_swallow_the_next(self):
+        sections = parse_sections("ARTICLE_SUMMARY:\n\nCOMMENT_SUMMARY:\nPeople agree.")
+        
+        assert sections["ARTICLE_SUMMARY"] == ""
+        assert sections["COMMENT_SUMMARY"] == "People agree."
+    
+    def test_empty_section_directly_followed_by_header(self):
+        sections = parse_sections("ARTICLE_SUMMARY:\nCOMMENT_SUMMARY:\nPeople agree.\nKEY_POINTS:\n1. a")
+        
+        assert sections == {
+            "ARTICLE_SUMMARY": "",
+            "COMMENT_SUMMARY": "People agree.",
+            "KEY_POINTS": "1. a",
+        }
+
+
 class TestOllamaSummarizer:
     
     def setup_method(self):
@@ -75,12 +194,12 @@ class TestOllamaSummarizer:
         assert result[0] == "Title: Test Article"
         assert "Content not available" in result[1]
     
-    @patch('hn_summarizer.summarizers.ollama.requests.post')
+    @patch('hn_summarizer.summarizers.ollama.requests.Session.post')
     def test_summarize_success(self, mock_post):
         mock_response = Mock()
-        mock_response.json.return_value = {
+        mock_response.content = orjson.dumps({
             "response": "Line 1 summary\nLine 2 summary\nLine 3 summary"
-        }
+        })
         mock_response.raise_for_status.return_value = None
         mock_post.return_value = mock_response
         
@@ -97,7 +216,32 @@ class TestOllamaSummarizer:
         assert result[1] == "Line 2 summary"
         assert result[2] == "Line 3 summary"
     
-    @patch('hn_summarizer.summarizers.ollama.requests.post')
+    @patch('hn_summarizer.summarizers.ollama.requests.Session.post')
+    def test_summarize_uses_llm_cache(self, mock_post):
+        self.summarizer.cache = LLMCache(ResponseCache(":memory:"))
+        mock_response = Mock()
+        mock_response.content = orjson.dumps({
+            "response": "Line 1 summary\nLine 2 summary\nLine 3 summary"
+        })
+        mock_response.raise_for_status.return_value = None
+        mock_post.return_value = mock_response
+        
+        content = ArticleContent(
+            title="Test Article",
+            content="Test content here",
+            url="https://example.com"
+        )
+        
+        first = self.summarizer.summarize(content)
+        second = self.summarizer.summarize(content)
+        
+        assert first == second
+        mock_post.assert_called_once()
+        payload = orjson.loads(mock_post.call_args.kwargs["data"])
+        assert payload["system"] == SUMMARY_SYSTEM_PROMPT
+        assert payload["prompt"].startswith("Title: Test Article")
+    
+    @patch('hn_summarizer.summarizers.ollama.requests.Session.post')
     def test_summarize_failure_fallback(self, mock_post):
         mock_post.side_effect = Exception("Connection failed")
         
@@ -113,10 +257,25 @@ class TestOllamaSummarizer:
         assert len(result) == 3
         assert result[0] == "Article: Test Article"
     
-    @patch('hn_summarizer.summarizers.ollama.requests.post')
+    @patch('hn_summarizer.summarizers.ollama.requests.Session.post')
+    def test_open_circuit_skips_requests(self, mock_post):
+        mock_post.side_effect = requests.ConnectionError("Connection refused")
+        
+        content = ArticleContent(
+            title="Test Article",
+            content="Test content here",
+            url="https://example.com"
+        )
+        
+        results = [self.summarizer.summarize(content) for _ in range(LLM_CIRCUIT_FAILURES + 2)]
+        
+        assert mock_post.call_count == LLM_CIRCUIT_FAILURES
+        assert results[-1][0] == "Article: Test Article"
+    
+    @patch('hn_summarizer.summarizers.ollama.requests.Session.post')
     def test_enhanced_summarize_success(self, mock_post):
         mock_response = Mock()
-        mock_response.json.return_value = {
+        mock_response.content = orjson.dumps({
             "response": """ARTICLE_SUMMARY:
 This article discusses AI development trends and their impact on software engineering.
 
@@ -132,7 +291,7 @@ RELATED_LINKS:
 1. Machine learning in software engineering
 2. AI code generation tools comparison  
 3. Future of programming with AI assistance"""
-        }
+        })
         mock_response.raise_for_status.return_value = None
         mock_post.return_value = mock_response
         
@@ -158,7 +317,7 @@ RELATED_LINKS:
         assert result.original_url == "https://example.com"
         assert "12345" in result.hn_discussion_url
     
-    @patch('hn_summarizer.summarizers.ollama.requests.post')
+    @patch('hn_summarizer.summarizers.ollama.requests.Session.post')
     def test_enhanced_summarize_fallback(self, mock_post):
         mock_post.side_effect = Exception("Connection failed")
         
@@ -200,9 +359,55 @@ class TestLLMAPISummarizer:
         assert result[0] == "Title: Test Article"
         assert "Content not available" in result[1]
     
-    @patch('os.getenv')
-    def test_summarize_no_api_key_fallback(self, mock_getenv):
-        mock_getenv.return_value = None
+    def test_fallback_shared_with_ollama(self):
+        ollama = OllamaSummarizer(SummarizerConfig(mode=SummarizerMode.OLLAMA))
+        
+        assert isinstance(self.summarizer.fallback, BasicSummarizer)
+        assert self.summarizer.fallback is ollama.fallback
+    
+    def test_parse_summary_response_keeps_first_three_lines(self):
+        lines = self.summarizer._parse_summary_response("Line 1\r\n\r\n  Line 2 \r\nLine 3\r\nLine 4\r\n")
+        
+        assert lines == ["Line 1", "Line 2", "Line 3"]
+    
+    @patch.dict('os.environ', {"OPENAI_API_KEY": "env-api-key"})
+    def test_api_key_read_at_construction(self):
+        summarizer = LLMAPISummarizer(SummarizerConfig(mode=SummarizerMode.LLMAPI))
+        
+        assert summarizer.api_key == "env-api-key"
+    
+    @patch.dict('os.environ', {"OPENAI_API_KEY": "env-api-key"})
+    def test_session_carries_auth_and_retries_posts(self):
+        summarizer = LLMAPISummarizer(SummarizerConfig(mode=SummarizerMode.LLMAPI))
+        adapter = summarizer.session.get_adapter(summarizer.api_url)
+        
+        assert summarizer.session.headers["Authorization"] == "Bearer env-api-key"
+        assert 429 in adapter.max_retries.status_forcelist
+        assert adapter.max_retries.is_retry("POST", 429)
+        assert adapter.max_retries.backoff_jitter > 0
+    
+    def test_connect_timeout_separate_from_read_timeout(self):
+        summarizer = LLMAPISummarizer(SummarizerConfig(mode=SummarizerMode.LLMAPI, timeout=90))
+        
+        connect, read = summarizer.request_timeout
+        assert connect < read == 90
+        assert self.summarizer.request_timeout[1] == OPENAI_TIMEOUT
+    
+    @patch('hn_summarizer.summarizers.llmapi.requests.Session.post')
+    def test_generate_waits_on_rate_limiter_for_uncached_calls(self, mock_post):
+        self.summarizer.cache = LLMCache(ResponseCache(":memory:"))
+        self.summarizer.rate_limiter = Mock()
+        mock_response = Mock()
+        mock_response.content = orjson.dumps({"choices": [{"message": {"content": "Reply"}}]})
+        mock_post.return_value = mock_response
+        
+        assert self.summarizer._generate("System", "Prompt", 10) == "Reply"
+        assert self.summarizer._generate("System", "Prompt", 10) == "Reply"
+        
+        self.summarizer.rate_limiter.wait.assert_called_once_with(self.summarizer.api_url)
+    
+    def test_summarize_no_api_key_fallback(self):
+        self.summarizer.api_key = None
         
         content = ArticleContent(
             title="Test Article",
@@ -216,18 +421,14 @@ class TestLLMAPISummarizer:
         assert len(result) == 3
         assert result[0] == "Article: Test Article"
     
-    @patch('os.getenv')
-    @patch('hn_summarizer.summarizers.llmapi.requests.post')
-    def test_summarize_success(self, mock_post, mock_getenv):
-        mock_getenv.return_value = "test-api-key"
+    @patch('hn_summarizer.summarizers.llmapi.requests.Session.post')
+    def test_summarize_success(self, mock_post):
+        self.summarizer.api_key = "test-api-key"
+        deltas = ["API Line 1\nAPI ", "Line 2\n", "\nAPI Line 3", "\nExtra line", "\n"]
+        events = [b"data: " + orjson.dumps({"choices": [{"delta": {"content": d}}]}) for d in deltas]
+        stream = iter([b": keep-alive", b""] + events + [b"data: [DONE]"])
         mock_response = Mock()
-        mock_response.json.return_value = {
-            "choices": [{
-                "message": {
-                    "content": "API Line 1\nAPI Line 2\nAPI Line 3"
-                }
-            }]
-        }
+        mock_response.iter_lines.return_value = stream
         mock_response.raise_for_status.return_value = None
         mock_post.return_value = mock_response
         
@@ -243,11 +444,21 @@ class TestLLMAPISummarizer:
         assert result[0] == "API Line 1"
         assert result[1] == "API Line 2" 
         assert result[2] == "API Line 3"
+        # Reading stopped once the third line was complete, and the connection was closed
+        assert next(stream) == events[-1]
+        mock_response.close.assert_called_once()
+        assert mock_post.call_args.kwargs["stream"] is True
+        payload = orjson.loads(mock_post.call_args.kwargs["data"])
+        assert payload["stream"] is True
+        
+        messages = payload["messages"]
+        assert messages[0] == {"role": "system", "content": SUMMARY_SYSTEM_PROMPT}
+        assert messages[1]["role"] == "user"
+        assert "Title: Test Article" in messages[1]["content"]
     
-    @patch('os.getenv')
-    @patch('hn_summarizer.summarizers.llmapi.requests.post')
-    def test_summarize_api_failure_fallback(self, mock_post, mock_getenv):
-        mock_getenv.return_value = "test-api-key"
+    @patch('hn_summarizer.summarizers.llmapi.requests.Session.post')
+    def test_summarize_api_failure_fallback(self, mock_post):
+        self.summarizer.api_key = "test-api-key"
         mock_post.side_effect = Exception("API error")
         
         content = ArticleContent(
@@ -262,12 +473,11 @@ class TestLLMAPISummarizer:
         assert len(result) == 3
         assert result[0] == "Article: Test Article"
     
-    @patch('os.getenv')
-    @patch('hn_summarizer.summarizers.llmapi.requests.post')
-    def test_enhanced_summarize_success(self, mock_post, mock_getenv):
-        mock_getenv.return_value = "test-api-key"
+    @patch('hn_summarizer.summarizers.llmapi.requests.Session.post')
+    def test_enhanced_summarize_success(self, mock_post):
+        self.summarizer.api_key = "test-api-key"
         mock_response = Mock()
-        mock_response.json.return_value = {
+        mock_response.content = orjson.dumps({
             "choices": [{
                 "message": {
                     "content": """ARTICLE_SUMMARY:
@@ -287,7 +497,7 @@ RELATED_LINKS:
 3. Commercial quantum computing applications"""
                 }
             }]
-        }
+        })
         mock_response.raise_for_status.return_value = None
         mock_post.return_value = mock_response
         
@@ -313,9 +523,8 @@ RELATED_LINKS:
         assert result.original_url == "https://example.com/quantum"
         assert "54321" in result.hn_discussion_url
     
-    @patch('os.getenv')
-    def test_enhanced_summarize_no_api_key_fallback(self, mock_getenv):
-        mock_getenv.return_value = None
+    def test_enhanced_summarize_no_api_key_fallback(self):
+        self.summarizer.api_key = None
         
         content = ArticleContent(
             title="Test Article",
@@ -335,10 +544,9 @@ RELATED_LINKS:
         assert len(result.key_points) == 3
         assert len(result.related_links) == 3
     
-    @patch('os.getenv')
-    @patch('hn_summarizer.summarizers.llmapi.requests.post')
-    def test_enhanced_summarize_api_failure_fallback(self, mock_post, mock_getenv):
-        mock_getenv.return_value = "test-api-key"
+    @patch('hn_summarizer.summarizers.llmapi.requests.Session.post')
+    def test_enhanced_summarize_api_failure_fallback(self, mock_post):
+        self.summarizer.api_key = "test-api-key"
         mock_post.side_effect = Exception("API error")
         
         content = ArticleContent(
@@ -367,7 +575,7 @@ class TestOllamaNoFallbackBehavior:
         config = SummarizerConfig(mode=SummarizerMode.OLLAMA, allow_fallback=False)
         self.summarizer = OllamaSummarizer(config)
     
-    @patch("hn_summarizer.summarizers.ollama.requests.post")
+    @patch("hn_summarizer.summarizers.ollama.requests.Session.post")
     def test_summarize_failure_raises_error(self, mock_post):
         mock_post.side_effect = Exception("Connection refused")
         
@@ -392,9 +600,8 @@ class TestLLMAPINoFallbackBehavior:
         config = SummarizerConfig(mode=SummarizerMode.LLMAPI, allow_fallback=False)
         self.summarizer = LLMAPISummarizer(config)
     
-    @patch("os.getenv")
-    def test_summarize_no_api_key_raises_error(self, mock_getenv):
-        mock_getenv.return_value = None
+    def test_summarize_no_api_key_raises_error(self):
+        self.summarizer.api_key = None
         
         content = ArticleContent(
             title="Test Article", 
@@ -409,10 +616,9 @@ class TestLLMAPINoFallbackBehavior:
             assert "OPENAI_API_KEY environment variable not set" in str(e)
             assert "Use --fallback to enable" in str(e)
     
-    @patch("os.getenv")
-    @patch("hn_summarizer.summarizers.llmapi.requests.post")
-    def test_summarize_api_failure_raises_error(self, mock_post, mock_getenv):
-        mock_getenv.return_value = "test-api-key"
+    @patch("hn_summarizer.summarizers.llmapi.requests.Session.post")
+    def test_summarize_api_failure_raises_error(self, mock_post):
+        self.summarizer.api_key = "test-api-key"
         mock_post.side_effect = Exception("API error")
         
         content = ArticleContent(